@@ -2,15 +2,23 @@
 import re
 import os
 import logging
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any
 from rules import rule_book as rbook
 from utils import helper as hfunc
 from utils import glue_utils as glue
 from utils import file_utils as futils
-from utils import s3_utils as s3utils
 from handler.iceberg_schema_handler import IcebergSchemaHandler
 
 
+# Compiled once at import and reused for every DDL file.
+TABLE_RGX = re.compile(r"""TABLE\s+(?:IF\s+NOT\s+EXISTS\s*)?`(\w+)\.(\w+)`""", re.IGNORECASE)
+COLUMN_RGX = re.compile(r"""`(\w+)`\s+(\w+(?:\(\d+(?:,\d+)?\))?),*""", re.IGNORECASE)
+# Databases with at least these many DDL files are fetched with a single
+# paginated GetTables call instead of one GetTable call per table.
+CATALOG_PREFETCH_MIN_TABLES = 5
+
 class Alterator:
     """
     Alterator class for managing and altering table schemas based on provided configurations and validations.
@@ -23,34 +31,63 @@ class Alterator:
         ddl_file_suffix (str): Suffix for DDL files.
         validate (bool): Flag to enable validation mode.
         force (bool): Flag to force schema updates despite incompatible changes.
+        max_workers (int): Number of threads used to process DDL files concurrently.
         config (dict): Configuration dictionary read from the DDL configuration file.
         logger (Logger): Logger instance for logging messages.
-        table_rgx (str): Regular expression for extracting table names from HQL files.
-        column_rgs (str): Regular expression for extracting column definitions from HQL files.
         hql_paths (list): List of validated HQL file paths.
         skipped_tables (list): List of tables that were skipped during processing.
         new_tables (list): List of new tables identified during processing.
         success_tables (list): List of tables that were successfully updated.
-        errored_tables (list): List of tables that encountered errors during processing.
+        errored_tables (list): List of tables that encountered errors during processing, and of
+            {"table_name": "", "filename", "reason", "details"} entries for files that failed as a whole.
         identical_tables (list): List of tables that were found to be identical.
+        catalog_cache (dict): Prefetched Glue Catalog table details per database.
+        result_counts (Counter): Number of recorded results per category.
         aws_account_id (str): AWS account ID.
 
     Methods:
         _initialize_paths(): Initializes the HQL paths based on the provided paths and configuration.
         _filter_files(): Filters the HQL files based on the provided configuration.
-        _read_file_content(fname): Reads the content of a file and processes it.
+        _read_file_content(fname, aws_account_id): Reads the content of a file and processes it.
         _extract_table_name(data, fname): Extracts the table name from the provided data using a regular expression.
         _validate_create_statement(data, table_name, fname): Validates if the provided HQL statement is a CREATE statement.
         _run_initial_validation(data, table_name): Runs initial validation checks on the provided data.
+        _prefetch_catalog(contents): Prefetches the Glue Catalog details for databases with many DDL files.
         _fetch_table_details(db, table): Fetches the details of a specified table from the AWS Glue Catalog.
         _validate_catalog(tbl_details, table_name): Runs initial validation on the schema present in AWS Glue Catalog.
         _validate_partition_columns(data, partition_keys, table_name): Validates the partition columns of the given HQL against the partition keys present in AWS Glue Catalog.
         _compare_schemas(data, columns, partition_keys): Compares the schemas between the provided data and catalog columns.
         _update_table_schema(db, table, tbl_details, added_cols_dlist, del_cols_dlist, table_name): Updates the schema of a specified table in the database.
+        _process_one(fname, data): Processes a single DDL file and returns its tagged results.
+        _record(results): Appends the tagged results to the respective result lists.
         alter_schema(): Alters the schema of tables based on the provided configurations and validations.
         get_results(): Generates a dictionary containing the results of the table analysis.
     """
-    def __init__(self, paths, path_key, ddl_config_path, ddl_file_prefix, ddl_file_suffix, validate, force):
+    __slots__ = (
+        "paths",
+        "path_key",
+        "ddl_config_path",
+        "ddl_file_prefix",
+        "ddl_file_suffix",
+        "config",
+        "logger",
+        "validate",
+        "force",
+        "max_workers",
+        "hql_paths",
+        "skipped_tables",
+        "new_tables",
+        "success_tables",
+        "errored_tables",
+        "identical_tables",
+        "non_parquet_tables",
+        "iceberg_tables",
+        "format_changed_tables",
+        "catalog_cache",
+        "result_counts",
+    )
+
+    def __init__(self, paths, path_key, ddl_config_path, ddl_file_prefix, ddl_file_suffix, validate, force, max_workers=16):
         self.paths = paths
         self.path_key = path_key
         self.ddl_config_path = ddl_config_path
@@ -58,10 +95,9 @@ class Alterator:
         self.ddl_file_suffix = ddl_file_suffix
         self.config = None
         self.logger = logging.getLogger("EA.process.alterator")
-        self.table_rgx = r"""TABLE [IF NOT EXISTS]*\s*`(\w+)[\.](\w+)`"""
-        self.column_rgs = r"""`(\w+)`\s+(\w+((\(\d+,\d+\))|(\(\d+\)))?),*"""
         self.validate = validate
         self.force = force
+        self.max_workers = max_workers
         self.hql_paths = []
         self.skipped_tables = []
         self.new_tables = []
@@ -71,8 +107,20 @@ class Alterator:
         self.non_parquet_tables = []
         self.iceberg_tables = []
         self.format_changed_tables = []
-        self.aws_account_id = hfunc.get_account_id()
+        self.catalog_cache = {}
+        self.result_counts = Counter()
+
 
+    @property
+    def aws_account_id(self):
+        """
+        AWS account ID, looked up on first use instead of in `__init__`.
+        `hfunc.get_account_id` is cached, so all instances share the lookup.
+
+        Returns:
+            str: The AWS account ID.
+        """
+        return hfunc.get_account_id()
 
     def _initialize_paths(self):
         """
@@ -86,18 +134,21 @@ class Alterator:
         """
         if self.paths:
             futils.check_paths(self.paths)
-            self.hql_paths = self.paths
+            # duplicate paths would list and process the same DDL files twice
+            self.hql_paths = list(dict.fromkeys(self.paths))
         # Checks if the DDL Configuration file path exists or not
         if self.ddl_config_path:
             futils.check_paths(self.ddl_config_path)
             if self.ddl_config_path.endswith(".yaml") and (os.path.isfile(self.ddl_config_path) or self.ddl_config_path.startswith("s3://")):
                 # Read the configuration YAML file
-                self.config = futils.read_yaml(self.ddl_config_path)
+                self.config = futils.read_yaml_cached(self.ddl_config_path)
+                futils.validate_ddl_config(self.config, self.ddl_config_path, self.path_key)
                 # Check if the HQL File path key exists.
                 if self.path_key in self.config:
                     # Check if the path is correct
                     futils.check_paths(self.config[self.path_key])
-                    self.hql_paths.append(self.config[self.path_key])
+                    if self.config[self.path_key] not in self.hql_paths:
+                        self.hql_paths.append(self.config[self.path_key])
                 else:
                     if not self.paths:
                         raise Exception(f"Provided key_for_path is not available in {self.ddl_config_path} configuration file")
@@ -123,7 +174,7 @@ class Alterator:
                 self.hql_paths, self.ddl_file_prefix, self.ddl_file_suffix
             )
 
-    def _read_file_content(self, fname):
+    def _read_file_content(self, fname, aws_account_id):
         """
         Reads the content of a file and processes it.
 
@@ -132,20 +183,18 @@ class Alterator:
         reads the file from the local filesystem.
 
         The content of the file is converted to lowercase, stripped of leading and
-        trailing whitespace, and formatted with the `aws_account_id` attribute.
+        trailing whitespace, and the `{aws_account_id}` placeholder is replaced
+        with the given AWS account ID (see `hfunc.normalize_ddl`).
 
         Args:
             fname (str): The path to the file. Can be an S3 URI or a local file path.
+            aws_account_id (str): The AWS account ID, resolved by the caller so that
+                the files read concurrently don't each look it up.
 
         Returns:
             str: The processed content of the file.
         """
-        if fname.startswith("s3://"):
-            file_content = s3utils.read_s3_file(fname)
-            return file_content.lower().strip().format(aws_account_id=self.aws_account_id)
-        else:
-            with open(fname, "r", encoding="utf-8") as filestream:
-                return filestream.read().lower().strip().format(aws_account_id=self.aws_account_id)
+        return hfunc.normalize_ddl(futils.read_file(fname), aws_account_id)
 
     def _extract_table_name(self, data, fname):
         """
@@ -159,7 +208,7 @@ class Alterator:
             tuple: A tuple containing the extracted table name in the format "db.table" and a boolean flag.
                    The boolean flag is False if the table name was successfully extracted, and True if there was an error.
         """
-        table_match = re.search(self.table_rgx, data, flags=re.IGNORECASE)
+        table_match = TABLE_RGX.search(data)
         if table_match:
             db, table = table_match.groups()
             return f"{db}.{table}", False
@@ -220,7 +269,7 @@ class Alterator:
             # Validations include initial checks name from RULE_BOOk that are failed.
             # + if ICEBERG check is passed.
             validations = list(filter(lambda x: not validation_results_info[x] and x != "ICEBERG_CHECK", validation_results_info)) + (["ICEBERG_CHECK"] if validation_results_info["ICEBERG_CHECK"] else [])
-            self.logger.debug(f"From inside intial validation, Validations: {validations}" )
+            self.logger.debug("From inside intial validation, Validations: %s", validations)
             if validations:
                 return {
                     "table_name": table_name,
@@ -231,9 +280,28 @@ class Alterator:
             else:
                 return None, False
 
+    def _prefetch_catalog(self, contents):
+        """
+        Prefetches the details of all the tables from the AWS Glue Catalog for
+        databases referred by at least `CATALOG_PREFETCH_MIN_TABLES` DDL files.
+
+        Args:
+            contents (list): The processed content of the DDL files.
+        """
+        matches = (TABLE_RGX.search(data) for data in contents if data)
+        tables_per_db = Counter(match.group(1) for match in matches if match)
+        for db, num_tables in tables_per_db.items():
+            if num_tables < CATALOG_PREFETCH_MIN_TABLES:
+                continue
+            db_tables = glue.get_tables(db)
+            if db_tables is not None:
+                self.logger.info("=> Prefetched %d tables from catalog for %s.", len(db_tables), db)
+                self.catalog_cache[db] = db_tables
+
     def _fetch_table_details(self, db, table):
         """
         Fetches the details of a specified table from the AWS Glue Catalog.
+        Uses the prefetched catalog details if the database was prefetched.
 
         Args:
             db (str): The name of the database.
@@ -244,6 +312,10 @@ class Alterator:
                 - dict or None: The details of the table if found, otherwise None.
                 - bool: True if there was an error fetching the table details, otherwise False.
         """
+        db_tables = self.catalog_cache.get(db)
+        if db_tables is not None:
+            tbl_details = db_tables.get(table)
+            return tbl_details, tbl_details is None
         tbl_details = glue.get_table_details(db, table)
         if isinstance(tbl_details, dict) and "Error" in tbl_details:
             return None, True
@@ -316,13 +388,12 @@ class Alterator:
             tuple: A tuple containing:
                 - added_cols_dlist (list): A list of dictionaries representing columns added in the schema.
                 - del_cols_dlist (list): A list of dictionaries representing columns deleted from the schema.
-                - merged_df (DataFrame): A DataFrame representing the merged schema comparison.
+                - changed_cols (list): A list of dictionaries with Name, Type_new and Type_old of columns whose data type changed.
         """
-        hql_cols = re.findall(self.column_rgs, data, flags=re.IGNORECASE)
-        hql_col_dlist = [{"Name": col[0], "Type": col[1]} for col in hql_cols]
+        hql_col_dlist = [{"Name": m.group(1), "Type": m.group(2)} for m in COLUMN_RGX.finditer(data)]
         catalog_col_list = columns + partition_keys
-        added_cols_dlist, del_cols_dlist, merged_df = hfunc.compare_schema(hql_col_dlist, catalog_col_list)
-        return added_cols_dlist, del_cols_dlist, merged_df
+        added_cols_dlist, del_cols_dlist, changed_cols = hfunc.compare_schema(hql_col_dlist, catalog_col_list)
+        return added_cols_dlist, del_cols_dlist, changed_cols
 
     def _update_table_schema(self, db, table, tbl_details, added_cols_dlist, del_cols_dlist, table_name):
         """
@@ -349,26 +420,30 @@ class Alterator:
             self.logger.info("=> Update is not required for `%s`", table_name)
             return None, True
 
+        # GetTable already returns the current version of the table.
+        previous_ver = tbl_details["Table"].get("VersionId") or glue.get_latest_table_version(db, table)
         if self.validate:
             self.logger.info("=> Table will be updated with the identified changes.")
-            current_ver = glue.get_latest_table_version(db, table)
             return {
                 "table_name": table_name,
-                "previous_version": current_ver,
-                "current_version": current_ver,
+                "previous_version": previous_ver,
+                "current_version": previous_ver,
                 "details": {
                     "add": added_cols_dlist,
                     "delete": del_cols_dlist,
                 },
             }, True
 
-        previous_ver = glue.get_latest_table_version(db, table)
         status, _, error = glue.update_table_schema(
             table=tbl_details,
             new_cols=added_cols_dlist,
             del_cols=del_cols_dlist,
         )
-        updated_ver = glue.get_latest_table_version(db, table)
+        if status:
+            # A successful UpdateTable creates exactly one new table version.
+            updated_ver = str(int(previous_ver) + 1)
+        else:
+            updated_ver = glue.get_latest_table_version(db, table)
         success_response = {
             "table_name": table_name,
             "previous_version": previous_ver,
@@ -404,6 +479,197 @@ class Alterator:
                 "new_format": hql_format.upper()
             }
 
+    def _process_one(self, fname, data):
+        """
+        Processes a single DDL file and identifies the changes needed for its table.
+
+        This method does not modify any state on the instance, so it can safely run
+        in a worker thread. Results are returned as a list of tagged tuples and are
+        recorded into the result lists by `_record`.
+
+        Args:
+            fname (str): The path to the DDL file. Can be an S3 URI or a local file path.
+            data (str): The processed content of the DDL file.
+
+        Returns:
+            list: A list of (category, payload) tuples, where category is one of
+                  "skipped", "new", "success", "errored", "identical", "non_parquet",
+                  "iceberg" or "format_changed".
+        """
+        logger = self.logger
+        logger.info("###### Process started for %s ######", fname)
+        results = []
+        if not data:
+            return results
+        table_name, skip = self._extract_table_name(data, fname)
+        if skip:
+            results.append(("skipped", {
+                "table_name": "",
+                "filename": fname,
+                "reason": "TableNameNotExtracted",
+            }))
+            return results
+
+        error, skip = self._validate_create_statement(data, table_name, fname)
+        if skip:
+            results.append(("skipped", error))
+            return results
+
+        error, skip = self._run_initial_validation(data, table_name)
+        logger.info("Validation results: %s", error)
+        db, table = table_name.split('.')
+        # Identify Text, Iceberg and new tables.
+        # Checks which validation is failed
+        # and assign it to actual list of tables.
+        # Identify the format change tables also here.
+        if skip:
+            tbl_info, is_new = self._fetch_table_details(db, table)
+            if is_new:
+                results.append(("new", table_name))
+                return results
+            # If table is not NEW check the validations.
+            # only parquet tables will be processed from here.
+            validations = error['type']
+            if "ICEBERG_CHECK" in validations:
+                # Check for format change table
+                is_format_changed, change_details = self._check_format_changed(tbl_info, "ICEBERG")
+                if is_format_changed:
+                    change_details["table"] = table_name
+                    results.append(("format_changed", change_details))
+                    ic_handler = IcebergSchemaHandler(table_name, data, requires_migration=True)
+                else:
+                    # TODO: Call Iceberg Handler from here ?
+                    ic_handler = IcebergSchemaHandler(table_name, data, requires_migration=False)
+                # Get all the iceberg schema updates
+                schema_updates = ic_handler.get_schema_updates()
+                # If there are updates, add it to Iceberg List else to identical list
+                if schema_updates:
+                    results.append(("iceberg", schema_updates))
+                else:
+                    results.append(("identical", table_name))
+                return results
+            if "PARQUET_CHECK" in validations:
+                # Check for format change table
+                is_format_changed, change_details = self._check_format_changed(tbl_info, "TEXT")
+                if is_format_changed:
+                    change_details["table"] = table_name
+                    results.append(("format_changed", change_details))
+                else:
+                    results.append(("non_parquet", table_name))
+                return results
+            if "EXTERNAL_TABLE" in validations:
+                results.append(("errored", table_name))
+                return results
+            # TODO: Check here where these should go
+            results.append(("skipped", error))
+            return results
+
+        tbl_details, error = self._fetch_table_details(db, table)
+        if error:
+            results.append(("new", table_name))
+            return results
+
+        # Checks if the format is changed to PARQUET table.
+        is_format_changed, change_details = self._check_format_changed(tbl_details, "PARQUET")
+        if is_format_changed:
+            change_details["table"] = table_name
+            results.append(("format_changed", change_details))
+            return results
+
+        # TODO: Do we really need this now ???? -- don't think so.
+        # error, skip = self._validate_catalog(tbl_details, table_name)
+        # if skip:
+        #     self.skipped_tables.append(error)
+        #     continue
+
+        tbl = tbl_details["Table"]
+        partition_keys = tbl["PartitionKeys"]
+        columns = tbl["StorageDescriptor"]["Columns"]
+        error, skip = self._validate_partition_columns(data, partition_keys, table_name)
+        if skip:
+            results.append(("skipped", error))
+            return results
+
+        # Schema comparison HQL vs GlueCatalog
+        added_cols_dlist, del_cols_dlist, changed_cols = self._compare_schemas(data, columns, partition_keys)
+        # Data type for column changed
+        if changed_cols:
+            logger.info("****Validating data type compatibility for %s****", table_name)
+            response, compatible, incompatible = rbook.check_dtype_compatibility(changed_cols)
+            # Incompatible data type change detected
+            if not response:
+                if self.force:
+                    logger.warning("FORCE flag is enabled. Table will be updated with incompatible data type changes.")
+                    new_dtype_cols, old_dtype_cols = hfunc.split_type_changes(changed_cols)
+                    added_cols_dlist += new_dtype_cols
+                    del_cols_dlist += old_dtype_cols
+                else:
+                    logger.info("==> Skipping schema update for %s", table_name)
+                    compatible_cols = hfunc.type_change_records(compatible)
+                    incompatible_cols = hfunc.type_change_records(incompatible)
+                    results.append(("skipped", {
+                        "table_name": table_name,
+                        "reason": "IncompatibleDataTypeError",
+                        "details": {
+                            "compatible": compatible_cols,
+                            "incompatible": incompatible_cols,
+                            "add": added_cols_dlist,
+                            "delete": del_cols_dlist,
+                        },
+                    }))
+                    return results
+            else:
+                if compatible:
+                    logger.info("Getting compatible datatype columns.")
+                    new_dtype_cols, old_dtype_cols = hfunc.split_type_changes(compatible)
+                    added_cols_dlist += new_dtype_cols
+                    del_cols_dlist += old_dtype_cols
+
+        success_response, status = self._update_table_schema(db, table, tbl_details, added_cols_dlist, del_cols_dlist, table_name)
+        if status:
+            if success_response:
+                results.append(("success", success_response))
+            else:
+                results.append(("identical", table_name))
+        else:
+            results.append(("errored", table_name))
+        return results
+
+    def _safe_process_one(self, fname, read_future):
+        """
+        Wraps `_process_one` so a failure on one file doesn't abort the whole run.
+
+        Args:
+            fname (str): The path to the DDL file.
+            read_future (Future): The future reading the content of the DDL file.
+
+        Returns:
+            list: The tagged results of `_process_one`, or an "errored" entry for the file,
+                  shaped like the skipped entries so it isn't mistaken for a table name.
+        """
+        try:
+            return self._process_one(fname, read_future.result())
+        except Exception as e:
+            self.logger.error("An error occurred while processing %s: %s", fname, e)
+            return [("errored", {
+                "table_name": "",
+                "filename": fname,
+                "reason": "FileProcessingError",
+                "details": f"{type(e).__name__}: {e}",
+            })]
+
+    def _record(self, results):
+        """
+        Appends the tagged results of `_process_one` to the respective result lists
+        and keeps the per category counts used by `get_results` up to date.
+
+        Args:
+            results (list): A list of (category, payload) tuples.
+        """
+        for category, payload in results:
+            getattr(self, f"{category}_tables").append(payload)
+            self.result_counts[category] += 1
+
     def alter_schema(self):
         """
         Alters the schema of tables based on the provided configurations and validations.
@@ -411,17 +677,14 @@ class Alterator:
         This method performs the following steps:
         1. Initializes paths.
         2. Filters the list of files to process.
-        3. Iterates over each file and processes it:
-            - Reads the file content.
-            - Extracts the table name.
-            - Validates the CREATE statement.
-            - Runs initial validation on the data.
-            - Fetches table details from the Glue Catalog.
-            - Validates the catalog information.
-            - Validates partition columns.
-            - Compares schemas between the file and the Glue Catalog.
-            - Validates data type compatibility.
-            - Updates the table schema if necessary.
+        3. Reads all the files concurrently from S3 or local filesystem.
+        4. Prefetches the Glue Catalog details for databases with many files.
+        5. Processes the files concurrently in a thread pool, each file is:
+            - Checked for table name, CREATE statement and initial validations.
+            - Compared with the table details from the Glue Catalog.
+            - Validated for partition columns and data type compatibility.
+            - Updated in the Glue Catalog if necessary.
+        6. Records the results of every file in the respective lists, in file order.
 
         The method handles various scenarios such as:
         - Skipping tables if the table name cannot be extracted.
@@ -431,159 +694,27 @@ class Alterator:
         - Updates table schema if schema updates present in HQL file are valid.
         - Logging and appending tables to respective lists based on the outcome (success, identical, skipped, errored).
 
+        The work per file is dominated by S3 and Glue round trips, so files are
+        processed by `max_workers` threads. Results are only recorded from the
+        calling thread, so the result lists need no locking.
+
         Exceptions:
-            Logs any exceptions that occur during the process.
+            Logs any exceptions that occur while processing a file and marks the file as errored.
 
         Returns:
             None
         """
         self._initialize_paths()
         final_file_list = self._filter_files()
-        try:
-            for fname in final_file_list:
-                self.logger.info("###### Process started for %s ######", fname)
-                data = self._read_file_content(fname)
-                if not data:
-                    continue
-                table_name, skip = self._extract_table_name(data, fname)
-                if skip:
-                    self.skipped_tables.append(
-                        {
-                            "table_name": "",
-                            "filename": fname,
-                            "reason": "TableNameNotExtracted",
-                        }
-                    )
-                    continue
-
-                error, skip = self._validate_create_statement(data, table_name, fname)
-                if skip:
-                    self.skipped_tables.append(error)
-                    continue
-
-                error, skip = self._run_initial_validation(data, table_name)
-                self.logger.info("Validation results: %s", error)
-                db, table = table_name.split('.')
-                # Identify Text, Iceberg and new tables.
-                # Checks which validation is failed
-                # and assign it to actual list of tables.
-                # Identify the format change tables also here.
-                if skip:
-                    tbl_info, is_new = self._fetch_table_details(db, table)
-                    if is_new:
-                        self.new_tables.append(table_name)
-                        continue
-                    # If table is not NEW check the validations.
-                    # only parquet tables will be processed from here.
-                    validations = error['type']
-                    if "ICEBERG_CHECK" in validations:
-                        # Check for format change table
-                        is_format_changed, change_details = self._check_format_changed(tbl_info, "ICEBERG")
-                        if is_format_changed:
-                            change_details["table"] = table_name
-                            self.format_changed_tables.append(change_details)
-                            ic_handler = IcebergSchemaHandler(table_name, data, requires_migration=True)
-                        else:
-                            # TODO: Call Iceberg Handler from here ?
-                            ic_handler = IcebergSchemaHandler(table_name, data, requires_migration=False)
-                        # Get all the iceberg schema updates
-                        schema_updates = ic_handler.get_schema_updates()
-                        # If there are updates, add it to Iceberg List else to identical list
-                        if schema_updates:
-                            self.iceberg_tables.append(schema_updates)
-                        else:
-                            self.identical_tables.append(table_name)
-                        continue
-                    if "PARQUET_CHECK" in validations:
-                        # Check for format change table
-                        is_format_changed, change_details = self._check_format_changed(tbl_info, "TEXT")
-                        if is_format_changed:
-                            change_details["table"] = table_name
-                            self.format_changed_tables.append(change_details)
-                        else:
-                            self.non_parquet_tables.append(table_name)
-                        continue
-                    if "EXTERNAL_TABLE" in validations:
-                        self.errored_tables.append(table_name)
-                        continue
-                    else:
-                        # TODO: Check here where these should go
-                        self.skipped_tables.append(error)
-                    continue
-
-                tbl_details, error = self._fetch_table_details(db, table)
-                if error:
-                    self.new_tables.append(table_name)
-                    continue
-                
-                # Checks if the format is changed to PARQUET table.
-                is_format_changed, change_details = self._check_format_changed(tbl_details, "PARQUET")
-                if is_format_changed:
-                    change_details["table"] = table_name
-                    self.format_changed_tables.append(change_details)
-                    continue
-
-                # TODO: Do we really need this now ???? -- don't think so.
-                # error, skip = self._validate_catalog(tbl_details, table_name)
-                # if skip:
-                #     self.skipped_tables.append(error)
-                #     continue
-
-                partition_keys = tbl_details["Table"]["PartitionKeys"]
-                error, skip = self._validate_partition_columns(data, partition_keys, table_name)
-                if skip:
-                    self.skipped_tables.append(error)
-                    continue
-
-                # Schema comparison HQL vs GlueCatalog
-                columns = tbl_details["Table"]["StorageDescriptor"]["Columns"]
-                added_cols_dlist, del_cols_dlist, merged_df = self._compare_schemas(data, columns, partition_keys)
-                # Data type for column changed
-                if not merged_df.empty:
-                    self.logger.info("****Validating data type compatibility for %s****", table_name)
-                    response, compatible, incompatible = rbook.check_dtype_compatibility(merged_df)
-                    # Incompatible data type change detected
-                    if not response:
-                        if self.force:
-                            self.logger.warning("FORCE flag is enabled. Table will be updated with incompatible data type changes.")
-                            new_dtype_cols = merged_df[["Name", "Type_new"]].rename(columns={"Type_new": "Type"}).to_dict("records")
-                            old_dtype_cols = merged_df[["Name", "Type_old"]].rename(columns={"Type_old": "Type"}).to_dict("records")
-                            added_cols_dlist += new_dtype_cols
-                            del_cols_dlist += old_dtype_cols
-                        else:
-                            self.logger.info("==> Skipping schema update for %s", table_name)
-                            compatible_cols = compatible[["Name", "Type_old", "Type_new"]].rename(columns={"Type_old": "Type", "Type_new": "updated_type"}).to_dict("records")
-                            incompatible_cols = incompatible[["Name", "Type_old", "Type_new"]].rename(columns={"Type_old": "Type", "Type_new": "updated_type"}).to_dict("records")
-                            self.skipped_tables.append({
-                                "table_name": table_name,
-                                "reason": "IncompatibleDataTypeError",
-                                "details": {
-                                    "compatible": compatible_cols,
-                                    "incompatible": incompatible_cols,
-                                    "add": added_cols_dlist,
-                                    "delete": del_cols_dlist,
-                                },
-                            })
-                            continue
-                    else:
-                        if not compatible.empty:
-                            self.logger.info("Getting compatible datatype columns.")
-                            new_dtype_cols = compatible[["Name", "Type_new"]].rename(columns={"Type_new": "Type"}).to_dict("records")
-                            old_dtype_cols = compatible[["Name", "Type_old"]].rename(columns={"Type_old": "Type"}).to_dict("records")
-                            added_cols_dlist += new_dtype_cols
-                            del_cols_dlist += old_dtype_cols
-
-                success_response, status = self._update_table_schema(db, table, tbl_details, added_cols_dlist, del_cols_dlist, table_name)
-                if status:
-                    if success_response:
-                        self.success_tables.append(success_response)
-                    else:
-                        self.identical_tables.append(table_name)
-                else:
-                    self.errored_tables.append(table_name)
-
-        except Exception as e:
-            self.logger.error("An error occurred: %s", e)
+        # resolved once on this thread, a cold lookup in every reader would run it per file.
+        aws_account_id = self.aws_account_id
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            read_futures = [
+                executor.submit(self._read_file_content, fname, aws_account_id) for fname in final_file_list
+            ]
+            self._prefetch_catalog([future.result() for future in read_futures if not future.exception()])
+            for results in executor.map(self._safe_process_one, final_file_list, read_futures):
+                self._record(results)
 
     def get_results(self):
         """
@@ -604,31 +735,26 @@ class Alterator:
                 - "skipped_tables" (list): List of skipped tables.
                 - "new_tables" (list): List of new tables.
                 - "success_tables" (list): List of successfully updated tables.
-                - "errored_tables" (list): List of tables that encountered errors.
+                - "errored_tables" (list): List of tables that encountered errors, and entries
+                  with "filename" and "reason" for files that failed as a whole.
                 - "identical_tables" (list): List of identical tables.
         """
         # return response and write response to S3.
+        counts = self.result_counts
         alterator_response = {
             "ResponseMetadata": {
                 "validation": str(self.validate),
                 "force": str(self.force),
                 "stats": {
-                    "num_tables_analyzed": len(self.skipped_tables)
-                    + len(self.new_tables)
-                    + len(self.errored_tables)
-                    + len(self.success_tables)
-                    + len(self.identical_tables)
-                    + len(self.non_parquet_tables)
-                    + len(self.iceberg_tables)
-                    + len(self.format_changed_tables),
-                    "num_updates": len(self.success_tables),
-                    "num_skipped": len(self.skipped_tables),
-                    "num_new": len(self.new_tables),
-                    "num_errored": len(self.errored_tables),
-                    "num_identical": len(self.identical_tables),
-                    "num_non_parquet_tables": len(self.non_parquet_tables),
-                    "num_iceberg_tables": len(self.iceberg_tables),
-                    "num_format_changed_tables": len(self.format_changed_tables)
+                    "num_tables_analyzed": sum(counts.values()),
+                    "num_updates": counts["success"],
+                    "num_skipped": counts["skipped"],
+                    "num_new": counts["new"],
+                    "num_errored": counts["errored"],
+                    "num_identical": counts["identical"],
+                    "num_non_parquet_tables": counts["non_parquet"],
+                    "num_iceberg_tables": counts["iceberg"],
+                    "num_format_changed_tables": counts["format_changed"]
                 },
             },
             "skipped_tables": self.skipped_tables,
@@ -1,16 +1,63 @@
 """Main class for Alterator, Sync and Validator"""
 import re
 import os
+import json
 from rules import rule_book as rbook
 from utils import helper as hfunc
 from utils import glue_utils as glue
 from utils import file_utils as futils
-from utils import s3_utils as s3utils
 import logging
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
 
 
 logger_sync = logging.getLogger("EA.process.sync")
 logger_alt = logging.getLogger("EA.process.alterator")
+# Compiled once at import and reused for every DDL file.
+# DDLs are lowercased when read, so the patterns are lowercase and
+# don't need re.IGNORECASE.
+TABLE_RGX = re.compile(r"""table\s+(?:if\s+not\s+exists\s*)?`(\w+)\.(\w+)`""")
+COLUMN_RGX = re.compile(r"""`(\w+)`\s+(\w+(?:\(\d+,\d+\))?),*""")
+# Upper bound for the threads processing DDL files concurrently.
+MAX_WORKERS = 32
+
+
+@dataclass
+class TableUpdatePlan:
+    """Schema changes identified for a table, applied after all the DDLs are processed."""
+    table_name: str
+    tbl_details: dict
+    added: list
+    deleted: list
+
+
+def _initial_checks(table_info):
+    """
+    Runs the initial checks of the rule book on the HQL or the
+    glue catalog table details.
+
+    Parameters
+    ----------
+    table_info : str or dict
+        HQL or table details from glue catalog.
+
+    Returns
+    -------
+    validation_type : list
+        Names of the failed checks, ICEBERG_CHECK is included for
+        iceberg tables as they are not supported here.
+    validation_results : bool
+        True if all the checks passed.
+    """
+    checks = hfunc.cached_initial_checks(table_info)
+    validation_type = [
+        name for name, passed in checks.items()
+        if not passed and name != "ICEBERG_CHECK"
+    ]
+    if checks.get("ICEBERG_CHECK"):
+        validation_type.append("ICEBERG_CHECK")
+    return validation_type, not validation_type
 
 
 def sync_tables(src, tgt, **kwargs):
@@ -36,25 +83,25 @@ def sync_tables(src, tgt, **kwargs):
         )
     src_db, src_tbl = src.split(".")
     tgt_db, tgt_tbl = tgt.split(".")
-    logger_sync.info(f"=> src details >> \n database: {src_db} \n table: {src_tbl}")
-    logger_sync.info(f"=> tgt details >> \n database: {tgt_db} \n table: {tgt_tbl}")
+    logger_sync.info("=> src details >> \n database: %s \n table: %s", src_db, src_tbl)
+    logger_sync.info("=> tgt details >> \n database: %s \n table: %s", tgt_db, tgt_tbl)
     src_tbl_details = glue.get_table_details(src_db, src_tbl)
     tgt_tbl_details = glue.get_table_details(tgt_db, tgt_tbl)
     if isinstance(src_tbl_details, dict):
         if "Error" in src_tbl_details:
             logger_sync.error(
-                f'Error occured while fetching src schema: {src_tbl_details["Error"]}'
+                "Error occured while fetching src schema: %s", src_tbl_details["Error"]
             )
             raise Exception(src_tbl_details["Error"])
     if isinstance(tgt_tbl_details, dict):
         if "Error" in tgt_tbl_details:
             logger_sync.error(
-                f'Error occured while fetching tgt schema: {tgt_tbl_details["Error"]}'
+                "Error occured while fetching tgt schema: %s", tgt_tbl_details["Error"]
             )
             raise Exception(tgt_tbl_details["Error"])
     # running initial validations
-    _, src_validation = hfunc.intial_checks(src_tbl_details)
-    _, tgt_validation = hfunc.intial_checks(tgt_tbl_details)
+    _, src_validation = _initial_checks(src_tbl_details)
+    _, tgt_validation = _initial_checks(tgt_tbl_details)
     if src_validation and tgt_validation:
         logger_sync.info("=> Initial Validation Passed")
         # compare partition columns
@@ -74,18 +121,18 @@ def sync_tables(src, tgt, **kwargs):
             else:
                 logger_sync.info("=> Parition Column check passed.")
         # Get columns that needs to be added or removed in tgt table as per src table to sync schema
-        new_cols, removed_cols, combined_df = hfunc.compare_schema(src_cols, tgt_cols)
-        logger_sync.debug(combined_df)
-        if not combined_df.empty and not force_upd:
-            logger_sync.info(f"****Validating data type compatibility for {tgt}****")
-            response, _, _ = rbook.check_dtype_compatibility(combined_df)
+        new_cols, removed_cols, changed_cols = hfunc.compare_schema(src_cols, tgt_cols)
+        logger_sync.debug(changed_cols)
+        if changed_cols and not force_upd:
+            logger_sync.info("****Validating data type compatibility for %s****", tgt)
+            response, _, _ = rbook.check_dtype_compatibility(changed_cols)
             if not response:
                 update_table = False
-                logger_sync.info.critical(f"Data type Validation failed for {tgt}")
+                logger_sync.critical("Data type Validation failed for %s", tgt)
                 raise Exception(f"Data type Validation failed for {tgt}")
             else:
                 update_table = True
-                logger_sync.info(f"=> Data type Validation passed for {tgt}")
+                logger_sync.info("=> Data type Validation passed for %s", tgt)
         else:
             update_table = True
         # if all the checks are passed update the table if validation = False
@@ -101,7 +148,7 @@ def sync_tables(src, tgt, **kwargs):
                                         due to {error_dict['Code']}: {error_dict['Message']}"""
                         )
                 else:
-                    logger_sync.info(f"=> nothing to update for {tgt}")
+                    logger_sync.info("=> nothing to update for %s", tgt)
             else:
                 logger_sync.info("=> Validation completed. <=")
     else:
@@ -109,6 +156,455 @@ def sync_tables(src, tgt, **kwargs):
     logger_sync.info("##### SYNC TABLE PROCESS COMPLETED #####")
 
 
+def _read_ddl_file(fname, aws_account_id):
+    """
+    Reads the DDL file from S3 or local filesystem, converts it to lowercase
+    and fills in the AWS account id.
+
+    Parameters
+    ----------
+    fname : str
+        Path to the DDL file, local or S3.
+    aws_account_id : str
+        AWS account id to be filled in the DDL.
+
+    Returns
+    -------
+    data : str
+        Processed content of the DDL file.
+    """
+    return hfunc.normalize_ddl(futils.read_file(fname), aws_account_id)
+
+
+def _fetch_catalog_tables(ddl_contents):
+    """
+    Fetches the Glue catalog details of all the tables in the DDLs
+    up front, with one batched fetch per database.
+    DDLs that are not CREATE statements or fail the initial checks are
+    skipped later anyway, so their tables are not fetched.
+    Tables that couldn't be fetched are left out, they are looked up again
+    while their DDL file is processed, where a failure only errors that file.
+
+    Parameters
+    ----------
+    ddl_contents : iterable
+        Processed contents of the DDL files.
+
+    Returns
+    -------
+    tbl_details_cache : dict
+        Table details keyed by (database, table).
+    """
+    tables_by_db = {}
+    for data in ddl_contents:
+        if not data.startswith("create"):
+            continue
+        table_match = TABLE_RGX.search(data)
+        # initial check results are cached, the workers reuse them
+        if table_match and _initial_checks(data)[1]:
+            db, table = table_match.groups()
+            tables_by_db.setdefault(db, []).append(table)
+    tbl_details_cache = {}
+    for db, tables in tables_by_db.items():
+        for table, tbl_details in glue.batch_get_tables(db, tables).items():
+            tbl_details_cache[(db, table)] = tbl_details
+    return tbl_details_cache
+
+
+def _validate_ddl(data, fname):
+    """
+    Validates the DDL: extracts the table name, checks that it is a
+    CREATE statement and runs the initial checks on it.
+
+    Parameters
+    ----------
+    data : str
+        Processed content of the DDL file.
+    fname : str
+        Path to the DDL file.
+
+    Returns
+    -------
+    table_name : str
+        db.table extracted from the DDL, None if it couldn't be extracted.
+    error : dict
+        Skipped table details in case of failure, None otherwise.
+    """
+    table_match = TABLE_RGX.search(data)
+    if not table_match:
+        logger_alt.error("==> Please validate the DDL format for %s", fname)
+        logger_alt.warning(
+            "==> Skipping schema update for table due to incorrect DDL Format in: %s", fname,
+        )
+        return None, {
+            "table_name": "",
+            "filename": fname,
+            "reason": "IncorrectSQLFormat",
+        }
+    db, table = table_match.groups()
+    table_name = f"{db}.{table}"
+    # Check if hql is create statement.
+    if not data.startswith("create"):
+        logger_alt.error(
+            "==> HQL provided for %s is not a create statement.", table_name
+        )
+        logger_alt.warning(
+            "==> skipping schema update for table: %s due to initial validation failure", table_name
+        )
+        # TODO: IncorrectSQLFormat
+        return table_name, {
+            "table_name": table_name,
+            "filename": fname,
+            "reason": "NonCreateSQL",
+        }
+    # run initial checks on HQL
+    logger_alt.info("*** Running initial validation.***")
+    validation_type, validation_results = _initial_checks(data)
+    if not validation_results:
+        logger_alt.error(
+            "==> Initial validation: %s failed for provided HQL %s.", validation_type, table_name
+        )
+        logger_alt.warning(
+            "==> skipping schema update for table: %s due to initial validation failure", table_name
+        )
+        # TODO: ValidationError
+        return table_name, {
+            "table_name": table_name,
+            "reason": "ValidationError",
+            "type": validation_type,
+            "from": "HQL",
+        }
+    logger_alt.info("=> Initial validations are successful for %s.", table_name)
+    return table_name, None
+
+
+def _validate_catalog(tbl_details, data, table_name):
+    """
+    Runs the initial checks on the glue catalog table and the partition
+    column check of the DDL against it.
+
+    Parameters
+    ----------
+    tbl_details : dict
+        Table details from glue catalog.
+    data : str
+        Processed content of the DDL file.
+    table_name : str
+        db.table name.
+
+    Returns
+    -------
+    errors : list
+        Skipped table details for every failed check, empty if all passed.
+    """
+    errors = []
+    # run initial checks
+    catalog_validation_type, catalog_validation = _initial_checks(tbl_details)
+    if catalog_validation:
+        logger_alt.info("=> Initial validation for catalog passed.")
+    else:
+        # TODO: ValidationError
+        errors.append({
+            "table_name": table_name,
+            "reason": "ValidationError",
+            "type": catalog_validation_type,
+            "from": "CATALOG",
+        })
+        logger_alt.error("==> Initial validation for catalog failed.")
+    # run partition column check
+    partition_keys = tbl_details["Table"]["PartitionKeys"]
+    if rbook.partition_col_check(data, partition_keys):
+        logger_alt.info("=> Partition Validation passed for %s.", table_name)
+    else:
+        # TODO: PartitionValidationError
+        errors.append({
+            "table_name": table_name,
+            "reason": "PartitionValidationError",
+        })
+        logger_alt.error("==> Partition Validation failed for %s.", table_name)
+    if errors:
+        logger_alt.error(
+            "==> Initial Validation failed or Change in partition column detected for %s", table_name
+        )
+    return errors
+
+
+def _compute_schema_diff(data, tbl_details, table_name, force):
+    """
+    Compares the DDL columns with the glue catalog columns.
+
+    Parameters
+    ----------
+    data : str
+        Processed content of the DDL file.
+    tbl_details : dict
+        Table details from glue catalog.
+    table_name : str
+        db.table name.
+    force : bool
+        Flag to force the incompatible data type changes.
+
+    Returns
+    -------
+    added_cols_dlist : list
+        Columns to be added.
+    del_cols_dlist : list
+        Columns to be deleted.
+    error : dict
+        Skipped table details in case of incompatible data type changes, None otherwise.
+    """
+    # Fetch all the columns from HQL file, columns can only be
+    # inside the parentheses after the table name.
+    cols_start = data.find("(")
+    cols_end = data.rfind(")")
+    hql_col_dlist = [
+        {"Name": col.group(1), "Type": col.group(2)}
+        for col in COLUMN_RGX.finditer(
+            data, max(cols_start, 0), cols_end + 1 or len(data)
+        )
+    ]
+
+    # getting all the columns from glue catalog
+    tbl = tbl_details["Table"]
+    catalog_col_list = tbl["StorageDescriptor"]["Columns"] + tbl["PartitionKeys"]
+    added_cols_dlist, del_cols_dlist, changed_cols = hfunc.compare_schema(
+        hql_col_dlist, catalog_col_list
+    )
+    if not changed_cols:
+        return added_cols_dlist, del_cols_dlist, None
+
+    logger_alt.info("****Validating data type compatibility for %s****", table_name)
+    response, compatible, incompatible = rbook.check_dtype_compatibility(changed_cols)
+    if not response:
+        if not force:
+            logger_alt.info("==> Skipping schema update for %s", table_name)
+            return added_cols_dlist, del_cols_dlist, {
+                "table_name": table_name,
+                "reason": "IncompatibleDataTypeError",
+                "details": {
+                    "compatible": hfunc.type_change_records(compatible),
+                    "incompatible": hfunc.type_change_records(incompatible),
+                    "add": added_cols_dlist,
+                    "delete": del_cols_dlist,
+                },
+            }
+        logger_alt.warning(
+            "FORCE flag is enabled. Table will be updated with incompatible data type changes."
+        )
+        new_dtype_cols, old_dtype_cols = hfunc.split_type_changes(changed_cols)
+    elif compatible:  # get the compatible data type changes if any
+        logger_alt.info("Getting compatible datatype columns.")
+        new_dtype_cols, old_dtype_cols = hfunc.split_type_changes(compatible)
+    else:
+        return added_cols_dlist, del_cols_dlist, None
+    return added_cols_dlist + new_dtype_cols, del_cols_dlist + old_dtype_cols, None
+
+
+def _apply_update_plan(plan, validate):
+    """
+    Updates the table schema in glue catalog as per the plan, only
+    reports the changes in case of validate.
+
+    Parameters
+    ----------
+    plan : TableUpdatePlan
+        Schema changes identified for the table.
+    validate : bool
+        dry runs the process without updating the table.
+
+    Returns
+    -------
+    result : tuple
+        (category, payload) with category success or errored.
+    """
+    table_name = plan.table_name
+    db, table = table_name.split(".")
+    # GetTable already returns the current version
+    previous_ver = plan.tbl_details["Table"].get(
+        "VersionId"
+    ) or glue.get_latest_table_version(db, table)
+    success_response = {
+        "table_name": table_name,
+        "previous_version": previous_ver,
+        "current_version": previous_ver,
+        "details": {
+            "add": plan.added,
+            "delete": plan.deleted,
+        },
+    }
+    if validate:
+        logger_alt.info("=> Table will be updated with the identified changes.")
+        return "success", success_response
+
+    status, _, error = glue.update_table_schema(
+        table=plan.tbl_details,
+        new_cols=plan.added,
+        del_cols=plan.deleted,
+    )
+    if not status:
+        logger_alt.error(
+            "==> Exception occurred while updating table schema for %s.", table_name
+        )
+        logger_alt.error("Exception details: %s - %s", error['Code'], error['Message'])
+        return "errored", table_name
+    # A successful UpdateTable creates exactly one new table version.
+    success_response["current_version"] = str(int(previous_ver) + 1)
+    return "success", success_response
+
+
+def _safe_apply_update_plan(plan, validate):
+    """
+    Wraps `_apply_update_plan` so a failed update is reported as
+    errored instead of aborting the remaining updates.
+    """
+    try:
+        return _apply_update_plan(plan, validate)
+    except Exception as ex:
+        logger_alt.error("==> Exception occurred while updating %s: %s", plan.table_name, ex)
+        return "errored", plan.table_name
+
+
+def _process_ddl_file(fname, data, tbl_details_cache, validate, force):
+    """
+    Processes a single DDL file for the ALTERATOR functionality.
+    Runs in a worker thread, so it doesn't touch any shared state and
+    only returns its results.
+
+    Parameters
+    ----------
+    fname : str
+        Path to the DDL file, local or S3.
+    data : str
+        Processed content of the DDL file.
+    tbl_details_cache : dict
+        Prefetched table details keyed by (database, table).
+    validate : bool
+        dry runs the process without updating the table.
+    force : bool
+        Flag to force the update of the table schema.
+
+    Returns
+    -------
+    results : list
+        List of (category, payload) tuples, category is one of
+        skipped, new, errored, identical or plan. The payload of
+        plan is the TableUpdatePlan to be applied.
+    """
+    logger_alt.info("###### Process started for %s ######", fname)
+    results = _alter_table(fname, data, tbl_details_cache, validate, force) if data else []
+    logger_alt.info("###### Process finished for %s ######", fname)
+    return results
+
+
+def _alter_table(fname, data, tbl_details_cache, validate, force):
+    """
+    Runs the validations and the schema update for the table in the DDL,
+    returning at the first failed step. Parameters and return value are
+    the same as `_process_ddl_file`.
+    """
+    table_name, error = _validate_ddl(data, fname)
+    if error:
+        return [("skipped", error)]
+
+    # get table details from the prefetched glue catalog details
+    db, table = table_name.split(".")
+    tbl_details = tbl_details_cache.get((db, table))
+    if tbl_details is None:
+        tbl_details = glue.get_table_details(db, table)
+    if "Error" in tbl_details:
+        # in case table doesn't exist in Glue catalog
+        logger_alt.error("==> %s doesn't exist in the system.", table_name)
+        return [("new", table_name)]
+
+    errors = _validate_catalog(tbl_details, data, table_name)
+    if errors:
+        return [("skipped", error) for error in errors]
+
+    added_cols_dlist, del_cols_dlist, error = _compute_schema_diff(
+        data, tbl_details, table_name, force
+    )
+    if error:
+        if not validate:
+            logger_alt.info("==> skipping schema update for table: %s", table_name)
+        else:
+            logger_alt.warning(
+                "==> schema update for table: %s will be skipped.", table_name
+            )
+        return [("skipped", error)]
+
+    if not (added_cols_dlist or del_cols_dlist):
+        logger_alt.info("=> Update is not required for `%s`", table_name)
+        return [("identical", table_name)]
+    return [("plan", TableUpdatePlan(
+        table_name, tbl_details, added_cols_dlist, del_cols_dlist
+    ))]
+
+
+def _file_error(fname, reason, ex):
+    """
+    Builds the errored entry for a DDL file that failed as a whole. Shaped
+    like the skipped entries, so it isn't mistaken for a table name.
+
+    Parameters
+    ----------
+    fname : str
+        Path to the DDL file.
+    reason : str
+        Step that failed, e.g. FileProcessingError.
+    ex : Exception
+        The exception raised.
+
+    Returns
+    -------
+    error : dict
+    """
+    return {
+        "table_name": "",
+        "filename": fname,
+        "reason": reason,
+        "details": f"{type(ex).__name__}: {ex}",
+    }
+
+
+def _safe_process_ddl_file(fname, data, tbl_details_cache, validate, force):
+    """
+    Wraps `_process_ddl_file` so a failure on one file is reported as
+    errored instead of aborting the whole batch.
+    """
+    try:
+        return _process_ddl_file(fname, data, tbl_details_cache, validate, force)
+    except Exception as ex:
+        logger_alt.error("==> Exception occurred while processing %s: %s", fname, ex)
+        return [("errored", _file_error(fname, "FileProcessingError", ex))]
+
+
+def _get_result_writer(result_sink):
+    """
+    Wraps the result sink passed to alterator into a callable taking the
+    result category and its payload.
+
+    Parameters
+    ----------
+    result_sink : callable or file-like
+        Callable taking (category, payload), or a file handle to which every
+        result is written as one JSON line.
+
+    Returns
+    -------
+    writer : callable
+        Callable taking (category, payload).
+    """
+    if not hasattr(result_sink, "write"):
+        return result_sink
+
+    def write_json_line(category, payload):
+        result_sink.write(
+            json.dumps({"category": category, "result": payload}, default=str) + "\n"
+        )
+
+    return write_json_line
+
+
 def alterator(**kwargs) -> dict:
     """
     Main ALTERATOR functionality method for altering the table schema.
@@ -133,6 +629,11 @@ def alterator(**kwargs) -> dict:
         dry runs the process and returns the result that will be made when the process is run.
     force : bool
         Flag to force the update of the table schema. IGNORES the data type compatibility validation.
+    result_sink : callable or file-like, optional
+        Receives every table result as soon as it is available, either as
+        a call with (category, payload) or as a JSON line written to the file
+        handle. When provided, the result lists in the response are left
+        empty and only the stats are kept in memory.
 
     Returns
     -------
@@ -146,6 +647,7 @@ def alterator(**kwargs) -> dict:
     ddl_file_suffix = kwargs.get("ddl_file_suffix")
     validate = kwargs.get("validate")
     force = kwargs.get("force")
+    result_sink = kwargs.get("result_sink")
 
     hql_paths = []
     config = {}
@@ -158,7 +660,8 @@ def alterator(**kwargs) -> dict:
         # Added support for reading from S3 file.
         if os.path.isfile(ddl_config_path) or ddl_config_path.startswith("s3://"):
             if ddl_config_path.endswith(".yaml"):
-                config = futils.read_yaml(ddl_config_path)
+                config = futils.read_yaml_cached(ddl_config_path)
+                futils.validate_ddl_config(config, ddl_config_path, path_key)
                 if path_key in config:
                     futils.check_paths(config[path_key])
                     hql_paths.append(config[path_key])
@@ -172,7 +675,7 @@ def alterator(**kwargs) -> dict:
         else:
             raise Exception("Please provide configuration file path with filename.")
 
-    logger_alt.info(f"=> DDL paths: {hql_paths}")
+    logger_alt.info("=> DDL paths: %s", hql_paths)
 
     # Extract files from path as per the suffix and prefix provided.
     if config:
@@ -184,350 +687,92 @@ def alterator(**kwargs) -> dict:
             hql_paths, ddl_file_prefix, ddl_file_suffix
         )
 
-    table_rgx = r"""TABLE [IF NOT EXISTS]*\s*`(\w+)[\.](\w+)`"""
-    column_rgs = r"""`(\w+)`\s+(\w+(\(\d+,\d+\))?),*"""
     skipped_tables = []
     new_tables = []
     success_tables = []
     errored_tables = []
     identical_tables = []
+    update_plans = []
+    result_counts = Counter()
+    result_lists = {
+        "skipped": skipped_tables,
+        "new": new_tables,
+        "success": success_tables,
+        "errored": errored_tables,
+        "identical": identical_tables,
+    }
+    write_result = _get_result_writer(result_sink) if result_sink else None
+
+    def add_result(category, payload):
+        if category == "plan":
+            update_plans.append(payload)
+            return
+        result_counts[category] += 1
+        if write_result:
+            write_result(category, payload)
+        else:
+            result_lists[category].append(payload)
 
     # Fetching AWS account id
     aws_account_id = hfunc.get_account_id()
     try:
-        # loop over DDL files:
-        for fname in final_file_list:
-            skip = False
-            move_to_next = False
-            logger_alt.info(f"###### Process started for {fname} ######")
-            if fname.startswith("s3://"):
-                file_content = s3utils.read_s3_file(fname)
-                data = (
-                    file_content.lower().strip().format(aws_account_id=aws_account_id)
+        max_workers = max(1, min(MAX_WORKERS, len(final_file_list)))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            # first pass: read all the DDL files concurrently, so the S3 GET
+            # latencies overlap, and fetch their tables from glue catalog
+            # in batches instead of one call per file.
+            read_futures = {
+                fname: executor.submit(_read_ddl_file, fname, aws_account_id)
+                for fname in final_file_list
+            }
+            ddl_contents = {}
+            for fname, read_future in read_futures.items():
+                try:
+                    ddl_contents[fname] = read_future.result()
+                except Exception as ex:
+                    logger_alt.error("==> Exception occurred while reading %s: %s", fname, ex)
+                    add_result("errored", _file_error(fname, "FileReadError", ex))
+            tbl_details_cache = _fetch_catalog_tables(ddl_contents.values())
+
+            # process DDL files concurrently, results are collected on this thread.
+            futures = [
+                executor.submit(
+                    _safe_process_ddl_file,
+                    fname,
+                    data,
+                    tbl_details_cache,
+                    validate,
+                    force,
                 )
-            else:
-                with open(fname, "r", encoding="utf-8") as filestream:
-                    data = (
-                        filestream.read()
-                        .lower()
-                        .strip()
-                        .format(aws_account_id=aws_account_id)
-                    )
-            if data:
-                table_match = re.search(table_rgx, data, flags=re.IGNORECASE)
-                if table_match:
-                    db, table = table_match.groups()
-                    table_name = f"{db}.{table}"
-                else:
-                    logger_alt.error(f"==> Please validate the DDL format for {fname}")
-                    skipped_tables.append(
-                        {
-                            "table_name": "",
-                            "filename": fname,
-                            "reason": "IncorrectSQLFormat",
-                        }
-                    )
-                    skip = True
-                if not skip:
-                    # Check if hql is create statement.
-                    if not data.startswith("create"):
-                        logger_alt.error(
-                            f"==> HQL provided for {table_name} is not a create statement."
-                        )
-                        # TODO: IncorrectSQLFormat
-                        skipped_tables.append(
-                            {
-                                "table_name": table_name,
-                                "filename": fname,
-                                "reason": "NonCreateSQL",
-                            }
-                        )
-                        skip = True
-                    else:
-                        # run initial checks on HQL
-                        logger_alt.info("*** Running initial validation.***")
-                        validation_type, validation_results = hfunc.intial_checks(data)
-                        if validation_results:
-                            logger_alt.info(
-                                f"=> Initial validations are successful for {table_name}."
-                            )
-                        else:
-                            logger_alt.error(
-                                f"==> Initial validation: {validation_type} failed for provided HQL {table_name}."
-                            )
-                            # TODO: ValidationError
-                            skipped_tables.append(
-                                {
-                                    "table_name": table_name,
-                                    "reason": "ValidationError",
-                                    "type": validation_type,
-                                    "from": "HQL",
-                                }
-                            )
-                            skip = True
-                    if not skip:
-                        # get table details from glue catalog
-                        tbl_details = glue.get_table_details(db, table)
-                        if isinstance(tbl_details, dict):
-                            if "Error" in tbl_details:
-                                # in case table doesn't exist in Glue catalog
-                                new_tables.append(table_name)
-                                move_to_next = True
-                            else:
-                                partition_keys = tbl_details["Table"]["PartitionKeys"]
-                                fetched_loc = tbl_details["Table"]["StorageDescriptor"][
-                                    "Location"
-                                ]
-                                columns = tbl_details["Table"]["StorageDescriptor"][
-                                    "Columns"
-                                ]
-                                # run initial checks
-                                (
-                                    catalog_validation_type,
-                                    catalog_validation,
-                                ) = hfunc.intial_checks(tbl_details)
-                                if catalog_validation:
-                                    logger_alt.info(
-                                        "=> Initial validation for catalog passed."
-                                    )
-                                else:
-                                    # TODO: ValidationError
-                                    skipped_tables.append(
-                                        {
-                                            "table_name": table_name,
-                                            "reason": "ValidationError",
-                                            "type": catalog_validation_type,
-                                            "from": "CATALOG",
-                                        }
-                                    )
-                                    skip = True
-                                    logger_alt.error(
-                                        "==> Initial validation for catalog failed."
-                                    )
-                                # run partition column check
-                                partition_validation = rbook.partition_col_check(
-                                    data, partition_keys
-                                )
-                                if partition_validation:
-                                    logger_alt.info(
-                                        f"=> Partition Validation passed for {table_name}."
-                                    )
-                                else:
-                                    # TODO: PartitionValidationError
-                                    skipped_tables.append(
-                                        {
-                                            "table_name": table_name,
-                                            "reason": "PartitionValidationError",
-                                        }
-                                    )
-                                    skip = True
-                                    logger_alt.error(
-                                        f"==> Partition Validation failed for {table_name}."
-                                    )
-                        if not move_to_next and not skip:
-                            # Fetch all the columns from HQL file:
-                            hql_cols = re.findall(column_rgs, data, flags=re.IGNORECASE)
-                            hql_col_dlist = [
-                                {"Name": col[0], "Type": col[1]} for col in hql_cols
-                            ]
-
-                            # getting all the columns from glue catalog
-                            catalog_col_list = columns + partition_keys
-                            (
-                                added_cols_dlist,
-                                del_cols_dlist,
-                                merged_df,
-                            ) = hfunc.compare_schema(hql_col_dlist, catalog_col_list)
-                            if not merged_df.empty:
-                                logger_alt.info(
-                                    f"****Validating data type compatibility for {table_name}****"
-                                )
-                                (
-                                    response,
-                                    compatible,
-                                    incompatible,
-                                ) = rbook.check_dtype_compatibility(merged_df)
-                                if not response:
-                                    if force:
-                                        logger_alt.warning(
-                                            "FORCE flag is enabled. Table will be updated with incompatible data type changes."
-                                        )
-                                        new_dtype_cols = (
-                                            merged_df[["Name", "Type_new"]]
-                                            .rename(columns={"Type_new": "Type"})
-                                            .to_dict("records")
-                                        )
-                                        old_dtype_cols = (
-                                            merged_df[["Name", "Type_old"]]
-                                            .rename(columns={"Type_old": "Type"})
-                                            .to_dict("records")
-                                        )
-                                        added_cols_dlist = (
-                                            added_cols_dlist + new_dtype_cols
-                                        )
-                                        del_cols_dlist = del_cols_dlist + old_dtype_cols
-                                    else:
-                                        logger_alt.info(
-                                            f"==> Skipping schema update for {table_name}"
-                                        )
-                                        # TODO: Add details dict.
-                                        compatible_cols = (
-                                            compatible[["Name", "Type_old", "Type_new"]]
-                                            .rename(
-                                                columns={
-                                                    "Type_old": "Type",
-                                                    "Type_new": "updated_type",
-                                                }
-                                            )
-                                            .to_dict("records")
-                                        )
-                                        incompatible_cols = (
-                                            incompatible[
-                                                ["Name", "Type_old", "Type_new"]
-                                            ]
-                                            .rename(
-                                                columns={
-                                                    "Type_old": "Type",
-                                                    "Type_new": "updated_type",
-                                                }
-                                            )
-                                            .to_dict("records")
-                                        )
-                                        skipped_tables.append(
-                                            {
-                                                "table_name": table_name,
-                                                "reason": "IncompatibleDataTypeError",
-                                                "details": {
-                                                    "compatible": compatible_cols,
-                                                    "incompatible": incompatible_cols,
-                                                    "add": added_cols_dlist,
-                                                    "delete": del_cols_dlist,
-                                                },
-                                            }
-                                        )
-                                        skip = True
-                                else:  # get the compatible data type changes if any
-                                    if not compatible.empty:
-                                        logger_alt.info(
-                                            "Getting compatible datatype columns."
-                                        )
-                                        new_dtype_cols = (
-                                            compatible[["Name", "Type_new"]]
-                                            .rename(columns={"Type_new": "Type"})
-                                            .to_dict("records")
-                                        )
-                                        old_dtype_cols = (
-                                            compatible[["Name", "Type_old"]]
-                                            .rename(columns={"Type_old": "Type"})
-                                            .to_dict("records")
-                                        )
-                                        added_cols_dlist = (
-                                            added_cols_dlist + new_dtype_cols
-                                        )
-                                        del_cols_dlist = del_cols_dlist + old_dtype_cols
-                            # TODO: incase of force update implement added_cols_list.append(new cols) and del_cols_dlist.append(old cols).
-                            if not skip:
-                                if added_cols_dlist or del_cols_dlist:
-                                    if not validate:
-                                        previous_ver = glue.get_latest_table_version(
-                                            db, table
-                                        )
-                                        status, _, error = glue.update_table_schema(
-                                            table=tbl_details,
-                                            new_cols=added_cols_dlist,
-                                            del_cols=del_cols_dlist,
-                                        )
-                                        updated_ver = glue.get_latest_table_version(
-                                            db, table
-                                        )
-                                        success_response = {
-                                            "table_name": table_name,
-                                            "previous_version": previous_ver,
-                                            "current_version": updated_ver,
-                                            "details": {
-                                                "add": added_cols_dlist,
-                                                "delete": del_cols_dlist,
-                                            },
-                                        }
-                                        if not status:
-                                            logger_alt.error(
-                                                f"==> Exception occurred while updating table schema for {table_name}."
-                                            )
-                                            logger_alt.error(
-                                                f"Exception details: {error['Code']} - {error['Message']}"
-                                            )
-                                            errored_tables.append(table_name)
-                                        else:
-                                            success_tables.append(success_response)
-                                    else:
-                                        logger_alt.info(
-                                            "=> Table will be updated with the identified changes."
-                                        )
-                                        current_ver = glue.get_latest_table_version(
-                                            db, table
-                                        )
-                                        success_response = {
-                                            "table_name": table_name,
-                                            "previous_version": current_ver,
-                                            "current_version": current_ver,
-                                            "details": {
-                                                "add": added_cols_dlist,
-                                                "delete": del_cols_dlist,
-                                            },
-                                        }
-                                        success_tables.append(success_response)
-                                else:
-                                    identical_tables.append(table_name)
-                                    logger_alt.info(
-                                        f"=> Update is not required for `{table_name}`"
-                                    )
-                            else:
-                                if not validate:
-                                    logger_alt.info(
-                                        f"==> skipping schema update for table: {table_name}"
-                                    )
-                                else:
-                                    logger_alt.warning(
-                                        f"==> schema update for table: {table_name} will be skipped."
-                                    )
-                        else:
-                            if move_to_next:
-                                logger_alt.error(
-                                    f"==> {table_name} doesn't exist in the system."
-                                )
-                            if skip:
-                                logger_alt.error(
-                                    f"==> Initial Validation failed or Change in partition column detected for {table_name}"
-                                )
-                    else:
-                        logger_alt.warning(
-                            f"==> skipping schema update for table: {table_name} due to initial validation failure"
-                        )
-                else:
-                    logger_alt.warning(
-                        f"==> Skipping schema update for table due to incorrect DDL Format in: {fname}",
-                    )
-            logger_alt.info(f"###### Process finished for {fname} ######")
+                for fname, data in ddl_contents.items()
+            ]
+            for future in as_completed(futures):
+                for category, payload in future.result():
+                    add_result(category, payload)
+
+            # second stage: apply the schema changes of all the tables,
+            # in validate mode the results come from the plans alone.
+            update_results = executor.map(
+                lambda plan: _safe_apply_update_plan(plan, validate), update_plans
+            )
+            for category, payload in update_results:
+                add_result(category, payload)
         # can be integrated with SNS if needed
-        logger_alt.debug(f"skipped tables: {skipped_tables}")
+        logger_alt.debug("skipped tables: %s", skipped_tables)
         logger_alt.debug(
-            f"new tables: {new_tables}"
+            "new tables: %s", new_tables
         )  # can be used for creating new tables directly
         alterator_response = {
             "ResponseMetadata": {
                 "validation": str(validate),
                 "force": str(force),
                 "stats": {
-                    "num_tables_analyzed": len(skipped_tables)
-                    + len(new_tables)
-                    + len(errored_tables)
-                    + len(success_tables)
-                    + len(identical_tables),
-                    "num_updates": len(success_tables),
-                    "num_skipped": len(skipped_tables),
-                    "num_new": len(new_tables),
-                    "num_errored": len(errored_tables),
-                    "num_identical": len(identical_tables),
+                    "num_tables_analyzed": sum(result_counts.values()),
+                    "num_updates": result_counts["success"],
+                    "num_skipped": result_counts["skipped"],
+                    "num_new": result_counts["new"],
+                    "num_errored": result_counts["errored"],
+                    "num_identical": result_counts["identical"],
                 },
             },
             "skipped_tables": skipped_tables,
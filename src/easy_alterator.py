@@ -7,41 +7,44 @@ import logging
 
 
 logger = logging.getLogger('EA')
-logger.setLevel(logging.DEBUG)
-con_hndlr = logging.StreamHandler()
-con_hndlr.setLevel(logging.DEBUG)
-fmtr = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
-con_hndlr.setFormatter(fmtr)
-logger.addHandler(con_hndlr)
 
 
 if __name__ == "__main__":
+    # logging is only configured when run as a script, not on import.
+    logger.setLevel(logging.DEBUG)
+    con_hndlr = logging.StreamHandler()
+    con_hndlr.setLevel(logging.DEBUG)
+    fmtr = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    con_hndlr.setFormatter(fmtr)
+    logger.addHandler(con_hndlr)
 
+    # flags passed on the command line, for the required= conditions below.
+    argv = set(sys.argv)
     parser = argparse.ArgumentParser()
     parser.add_argument(
         "-p",
         "--path",
         nargs="*",
-        required="--config" not in sys.argv
-        and "-c" not in sys.argv
-        and "--sync" not in sys.argv,
+        required="--config" not in argv
+        and "-c" not in argv
+        and "--sync" not in argv,
         help="Paths to DDL folder separated by space.",
     )
     parser.add_argument(
         "-c",
         "--config",
         type=str,
-        required="--path" not in sys.argv
-        and "-p" not in sys.argv
-        and "--sync" not in sys.argv,
+        required="--path" not in argv
+        and "-p" not in argv
+        and "--sync" not in argv,
         help="DDL config yaml.",
     )
     parser.add_argument(
         "-cp",
         "--key_for_path",
         type=str,
-        required=("--path" not in sys.argv and "-p" not in sys.argv)
-        and ("--config" in sys.argv or "-c" in sys.argv),
+        required=("--path" not in argv and "-p" not in argv)
+        and ("--config" in argv or "-c" in argv),
         help="Key in DDL config file for reading path to DDL folder.",
     )
     parser.add_argument(
@@ -76,14 +79,14 @@ if __name__ == "__main__":
         "-src",
         "--source_table",
         type=str,
-        required="--sync" in sys.argv,
+        required="--sync" in argv,
         help="source table for sync option. Reference table for updating target table schema.",
     )
     parser.add_argument(
         "-tgt",
         "--target_table",
         type=str,
-        required="--sync" in sys.argv,
+        required="--sync" in argv,
         help="target table for sync option. Table whose schema needs to be updated.",
     )
     parser.add_argument(
@@ -103,7 +106,7 @@ if __name__ == "__main__":
 
     # print(sys.argv)
     args = parser.parse_args()
-    logger.info(f"Arguments passed: {vars(args)}")
+    logger.info("Arguments passed: %s", vars(args))
     paths = args.path
     ddl_config_path = args.config
     path_key = args.key_for_path
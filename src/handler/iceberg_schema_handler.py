@@ -1,14 +1,42 @@
 """Main Class for getting the Iceberg Table Schema Changes."""
 
 from typing import Dict, Any, Tuple, List, Union
+import hashlib
 import json
 import logging
+import os
 import re
-from operator import itemgetter
-import pandas as pd
-from utils.s3_utils import read_s3_file
+from functools import lru_cache
+from sys import intern
+from utils.s3_utils import load_iceberg_metadata
 from utils.glue_utils import get_table_details
 
+# Compiled once at import and shared by every handler instance.
+CREATE_TABLE_RGX = re.compile(r"""CREATE\b[^(]*\(""", re.IGNORECASE)
+COLUMN_RGX = re.compile(
+    r"""(--\s*[^\n`]*)?\s*`([\w-]+)`\s+(\w+(?:\(\d+(?:,\d+)?\))?)""", re.IGNORECASE
+)
+PARTITION_COL_RGX = re.compile(r"""(--[^\n`]*)?\s*`([^`]+)`""")
+TBLPROP_KV_RGX = re.compile(r"""'([\w.-]+)'='([\w.-]+)'""")
+# Top level keys of the Iceberg metadata JSON the schema is read from.
+METADATA_KEYS = frozenset(
+    {"schemas", "current-schema-id", "partition-specs", "default-spec-id", "properties"}
+)
+# Catalog table properties that aren't actual Iceberg properties.
+SKIP_PROPS = frozenset({"owner"})
+# Set this environment variable to cache the schema comparison results on
+# disk, keyed by the HQL and the table's current metadata_location.
+SCHEMA_CACHE_ENV = "EASY_ALTERATOR_SCHEMA_CACHE"
+SCHEMA_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".easy-alterator", "cache", "iceberg")
+
+
+def _is_separator(text: str) -> bool:
+    """Check that the text between two clause items only holds commas,
+    whitespace and `--` comments."""
+    return not any(
+        line.split("--", 1)[0].strip(" \t\r,") for line in text.split("\n")
+    )
+
 
 class IcebergSchemaHandler:
     """Class to get the schema changes for Iceberg Tables.
@@ -32,9 +60,6 @@ class IcebergSchemaHandler:
         catalog (str): The catalog type
         migration (bool): Whether table requires migration
         logger (Logger): Logger instance
-        col_rgx (str): Regex pattern for matching column definitions
-        partition_col_rgx (str): Regex pattern for matching partition columns
-        tblprop_rgx (str): Regex pattern for matching table properties
     """
 
     def __init__(
@@ -52,40 +77,159 @@ class IcebergSchemaHandler:
         self.catalog = catalog
         self.migration = requires_migration
         self.logger = logging.getLogger("EA.handler.iceberg_handler")
-        self.col_rgx = (
-            r"""(--\s*[^\n`]*)?\s*`([\w-]+)`\s+(\w+((\(\d+,\d+\))|(\(\d+\)))?),*"""
+
+    @staticmethod
+    def _get_column_block(hql: str) -> Tuple[str, int]:
+        """Get the column definitions of the HQL, i.e. the text between the
+        opening parenthesis after CREATE TABLE and its matching closing one,
+        along with the position right after the block, where the table
+        clauses start. Parentheses in `--` comments are not counted.
+        Falls back to the whole HQL if the block can't be found."""
+        create_match = CREATE_TABLE_RGX.search(hql)
+        if not create_match:
+            return hql, 0
+        start = create_match.end()
+        end = IcebergSchemaHandler._find_closing_paren(hql, start - 1)
+        if end == -1:
+            return hql[start:], len(hql)
+        return hql[start:end], end + 1
+
+    @staticmethod
+    def _find_closing_paren(hql: str, open_pos: int) -> int:
+        """Get the position of the parenthesis closing the one at open_pos,
+        -1 if it isn't closed. Parentheses in quoted strings and in `--`
+        comments are not counted."""
+        depth = 0
+        pos = open_pos
+        while pos < len(hql):
+            char = hql[pos]
+            if char == "'" or char == '"':
+                pos = hql.find(char, pos + 1)
+            elif char == "-" and hql.startswith("--", pos):
+                pos = hql.find("\n", pos)
+            elif char == "(":
+                depth += 1
+            elif char == ")":
+                depth -= 1
+                if depth == 0:
+                    return pos
+            if pos == -1:
+                return -1
+            pos += 1
+        return -1
+
+    @staticmethod
+    def _find_clause_block(
+        hql: str, hql_upper: str, keyword: str, start: int
+    ) -> Union[str, None]:
+        """Get the text between the parentheses following the clause keyword,
+        e.g. TBLPROPERTIES (...), searching from start. hql_upper is the
+        uppercased HQL, so the keyword is matched case-insensitively with
+        str.find. Returns None if the clause isn't there."""
+        pos = hql_upper.find(keyword, start)
+        while pos != -1:
+            open_pos = pos + len(keyword)
+            while open_pos < len(hql) and hql[open_pos].isspace():
+                open_pos += 1
+            if hql.startswith("(", open_pos):
+                close_pos = IcebergSchemaHandler._find_closing_paren(hql, open_pos)
+                if close_pos != -1:
+                    return hql[open_pos + 1 : close_pos]
+            pos = hql_upper.find(keyword, pos + 1)
+        return None
+
+    @staticmethod
+    def _match_block_items(block: str, item_rgx: re.Pattern) -> List[Tuple]:
+        """Get the groups of every item_rgx match in the clause block. The
+        block must hold nothing but these items, separated by commas,
+        whitespace or `--` comments, otherwise nothing is matched, e.g. for
+        partition transforms like days(`ts`)."""
+        items = []
+        pos = 0
+        for item_match in item_rgx.finditer(block):
+            items.append(item_match.groups(""))
+            if not _is_separator(block[pos : item_match.start()]):
+                return []
+            pos = item_match.end()
+        if not _is_separator(block[pos:]):
+            return []
+        return items
+
+    @staticmethod
+    def _iter_column_lines(column_block: str):
+        """Yield (comment, name, type) for every column definition in the
+        column block, scanning it line by line. Lines without a backtick
+        can't define a column and are skipped without running the regex."""
+        for line in column_block.splitlines():
+            if "`" not in line:
+                continue
+            for column_match in COLUMN_RGX.finditer(line):
+                yield column_match.groups("")
+
+    @staticmethod
+    @lru_cache(maxsize=128)
+    def _parse_hql(hql: str) -> Tuple[Tuple, Tuple, Tuple]:
+        """Parse the HQL into (id, name, type) column tuples, (field-id, name)
+        partition column tuples and (key, value) table property tuples.
+        Cached by the HQL string, as the same DDL is often compared more than
+        once per run, e.g. validated first and then applied. Immutable
+        tuples, so the cached result can't be changed by the callers.
+        Commented columns and partition columns are deleted ones, they still
+        take up an id, so the ids of the following columns stay the same,
+        but are left out of the returned tuples."""
+        # The HQL is read front to back once: the column block first, then the
+        # table clauses after it for PARTITIONED BY and TBLPROPERTIES.
+        column_block, clauses_start = IcebergSchemaHandler._get_column_block(hql)
+        column_matches = IcebergSchemaHandler._iter_column_lines(column_block)
+        columns = tuple(
+            # names and types repeat across tables, interned to share one copy
+            (id, intern(column[1].lower()), intern(column[2]))
+            for id, column in enumerate(column_matches, start=1)
+            if "--" not in column[0]
+        )
+
+        # Spark allows the table clauses in any order. The clause blocks are
+        # found with str.find, only their small contents go through a regex.
+        hql_upper = hql.upper()
+        partition_block = IcebergSchemaHandler._find_clause_block(
+            hql, hql_upper, "PARTITIONED BY", clauses_start
+        )
+        partition_columns = (
+            IcebergSchemaHandler._match_block_items(partition_block, PARTITION_COL_RGX)
+            if partition_block is not None
+            else []
         )
-        self.partition_col_rgx = r"""PARTITIONED BY \(\s*((?:(?:--[^\n]*)?\s*`[^`]+`\s*(?:,|\n|\r\n)?\s*)+)\)"""
-        self.tblprop_rgx = (
-            r"""TBLPROPERTIES\s*\(\s*((?:'[\w.-]+'='[\w.-]+'\s*,?\s*)+)\)"""
+        partitions = tuple(
+            (id, intern(col_tup[1].lower()))
+            for id, col_tup in enumerate(partition_columns, start=1000)
+            if not col_tup[0]
         )
 
+        tblprop_block = IcebergSchemaHandler._find_clause_block(
+            hql, hql_upper, "TBLPROPERTIES", clauses_start
+        )
+        tblprops = (
+            IcebergSchemaHandler._match_block_items(tblprop_block, TBLPROP_KV_RGX)
+            if tblprop_block is not None
+            else []
+        )
+        return columns, partitions, tuple(tblprops)
+
     # TODO: Fetch columns, partition details, TBLPROPERTIES,  with sequence from HQL file
-    def _get_schema_details_hql(self) -> Tuple[List, List, Dict]:
+    def _get_schema_details_hql(self) -> Tuple[List, List, Dict[str, str]]:
         """Fetch Column, partitions and table properties
-        detail from HQL string using REGEX."""
-
-        column_matches = re.findall(self.col_rgx, self.hql, flags=re.IGNORECASE)
-        # Add commented here to identify delete columns
+        detail from HQL string using REGEX.
+        New dicts are built from the cached parse on every call, as they end
+        up in the schema updates returned to the caller."""
+        columns, partitions, tblprops = self._parse_hql(self.hql)
         column_details = [
-            {
-                "id": id,
-                "name": column[1],
-                "type": column[2],
-                "commented": True if "--" in column[0] else False,
-            }
-            for id, column in enumerate(column_matches, start=1)
+            {"id": id, "name": name, "type": col_type}
+            for id, name, col_type in columns
         ]
 
-        partition_matches = re.search(self.partition_col_rgx, self.hql, re.DOTALL | re.IGNORECASE)
-        if partition_matches:
-            columns_string = partition_matches.group(1)
-            partition_columns = re.findall(
-                r"(--[^\n`]*)?\s*`([^`]+)`", columns_string, re.DOTALL | re.IGNORECASE
-            )
+        if partitions:
             partition_details = [
-                {"field-id": id, "name": col_tup[1], "commented": bool(col_tup[0])}
-                for id, col_tup in enumerate(partition_columns, start=1000)
+                {"field-id": id, "name": name} for id, name in partitions
             ]
             self.logger.debug("HQL Partition Details %s", partition_details)
         else:
@@ -94,14 +238,11 @@ class IcebergSchemaHandler:
             )
             partition_details = []
 
-        tblprop_matches = re.search(self.tblprop_rgx, self.hql, re.DOTALL | re.IGNORECASE)
-        if tblprop_matches:
-            properties_string = tblprop_matches.group(1)
-            tblprops = re.findall(r"'([\w.-]+)'='([\w.-]+)'", properties_string)
+        if tblprops:
             tblprop_details = dict(tblprops)
         else:
             self.logger.info("No TBLPROPERTIES present in HQL for table %s", self.table)
-            tblprop_details = []
+            tblprop_details = {}
         return column_details, partition_details, tblprop_details
 
     # Get metadata JSON locaiton from Glue Catalog -- if migration=False
@@ -115,111 +256,116 @@ class IcebergSchemaHandler:
     def _get_schema_details_metadata(
         self, metadata_json_path: str
     ) -> Tuple[List, List, Dict[str, str]]:
-        metadata_str = read_s3_file(metadata_json_path)
-        metadata = json.loads(metadata_str)
-        column_details = metadata["schemas"][metadata["current-schema-id"]]["fields"]
-        partition_details = metadata["partition-specs"][metadata["default-spec-id"]][
-            "fields"
-        ]
-        tblprop_details = metadata["properties"]
-        # Removing owner properties as this is not an actual iceberg property
-        tblprop_details.pop("owner", None)
+        metadata = load_iceberg_metadata(metadata_json_path, METADATA_KEYS)
+        # schemas and specs are lists of objects carrying their own ids, the
+        # current ids are not positions in these lists.
+        schemas_by_id = {schema["schema-id"]: schema for schema in metadata["schemas"]}
+        specs_by_id = {spec["spec-id"]: spec for spec in metadata["partition-specs"]}
+        column_details = self._lower_names(
+            schemas_by_id[metadata["current-schema-id"]]["fields"]
+        )
+        partition_details = self._lower_names(
+            specs_by_id[metadata["default-spec-id"]]["fields"]
+        )
+        # Removing owner properties as this is not an actual iceberg property,
+        # on a copy as the metadata dict is cached.
+        tblprop_details = {
+            key: value
+            for key, value in metadata["properties"].items()
+            if key not in SKIP_PROPS
+        }
         return column_details, partition_details, tblprop_details
 
+    @staticmethod
+    def _lower_names(records: List[Dict]) -> List[Dict]:
+        """Lowercase the names of the metadata records, like the HQL ones, as
+        Spark resolves column names case-insensitively. Records with a mixed
+        case name are copied, the metadata dict is cached and not changed."""
+        return [
+            record
+            if record["name"] == record["name"].lower()
+            else {**record, "name": record["name"].lower()}
+            for record in records
+        ]
+
     def _get_schema_details(self, tbl_dict: Dict[str, Any]) -> Tuple[List, List, Dict]:
         """Get Table Schema details from Glue Catalog. Should only be called
         when migration is True, i.e. Glue Catalog still has this table as Parquet
         and will be migrated to ICEBERG."""
         columns = tbl_dict["StorageDescriptor"]["Columns"]
         partition_cols = tbl_dict["PartitionKeys"]
-        all_columns: Dict[str, str] = columns + partition_cols
+        all_columns: List[Dict[str, str]] = columns + partition_cols
         if all_columns:
-            # id column added to match the spec same as ICEBERG table.
+            # id column added and keys lowercased to match the spec same as
+            # ICEBERG table, so both are compared the same way.
             column_details = [
-                {"id": i, **d} for i, d in enumerate(all_columns, start=1)
+                {"id": i, "name": intern(d["Name"].lower()), "type": intern(d["Type"])}
+                for i, d in enumerate(all_columns, start=1)
             ]
             # only name and field-id is requried from this.
             partition_details = [
-                {"field-id": i, **d} for i, d in enumerate(partition_cols, start=1000)
+                {"field-id": i, "name": intern(d["Name"].lower())}
+                for i, d in enumerate(partition_cols, start=1000)
             ]
             # TBLPROPERTIES dict doesn't matter as table is parquet currently.
             return column_details, partition_details, {}
         else:
             raise Exception("No columns extracted from Glue Catalog.")
 
+    @staticmethod
+    def _join_on_key(
+        old_records: List[Dict], new_records: List[Dict], key: str
+    ) -> List[Tuple[Union[Dict, None], Union[Dict, None]]]:
+        """Full outer join of two lists of records on the given key.
+        Returns (old, new) record pairs sorted by the key, with None on the
+        side where the key is missing. Both lists are non-empty, the
+        callers handle an empty side themselves."""
+        old_by_key = {record[key]: record for record in old_records}
+        new_by_key = {record[key]: record for record in new_records}
+        return [
+            (old_by_key.get(k), new_by_key.get(k))
+            for k in sorted(old_by_key.keys() | new_by_key.keys())
+        ]
+
     def _compare_schemas(
         self, catalog_details: Dict[str, Any], hql_details: Dict[str, Any]
     ) -> Dict[str, Any]:
-        self.logger.info(
+        # full schemas, can be very large for wide tables
+        self.logger.debug(
             "Catalog details received for schema comparison: \n %s", catalog_details
         )
-        self.logger.info(
+        self.logger.debug(
             "HQL details received for schema comparison: \n %s", hql_details
         )
         comparison_results = {"table": f"{self.ic_catalog}.{self.table}"}
 
         # Comparing Columns
         if catalog_details.get("columns") and hql_details.get("columns"):
-            catalog_df = pd.DataFrame(catalog_details.get("columns"))
-            if self.migration:
-                catalog_df = catalog_df.rename(columns={"Name": "name", "Type": "type"})
-
-            # Filter out all the records that has commented as true -- deleted columns
-            filtered_cols = list(
-                filter(lambda x: not x["commented"], hql_details.get("columns"))
-            )
-            hql_df = pd.DataFrame(filtered_cols)
-
-            # Comparing both the schemas here.
-            merged_df = pd.merge(
-                catalog_df, hql_df, on=["id"], how="outer", suffixes=["_old", "_new"]
-            )
-
-            new_cols = (
-                merged_df.loc[
-                    lambda df: (df["name_old"].isna()) & (df["type_old"].isna()),
-                    ["id", "name_new", "type_new"],
-                ]
-                .rename(columns={"name_new": "name", "type_new": "type"})
-                .to_dict("records")
-            )
-
-            deleted_cols = [
-                row["name_old"]
-                for row in merged_df.loc[
-                    lambda df: (df["name_new"].isna()) & (df["type_new"].isna()),
-                    ["name_old"],
-                ].to_dict("records")
-            ]
-
-            renamed_cols = (
-                merged_df.loc[
-                    lambda df: (df["name_old"] != df["name_new"])
-                    & (df["type_old"] == df["type_new"]),
-                    ["name_old", "name_new"],
-                ]
-                .rename(columns={"name_old": "old_name", "name_new": "new_name"})
-                .to_dict("records")
-            )
-
-            updated_cols = (
-                merged_df.loc[
-                    lambda df: (df["name_old"] == df["name_new"])
-                    & (df["type_old"] != df["type_new"]),
-                    ["name_old", "type_old", "type_new"],
-                ]
-                .rename(
-                    columns={
-                        "name_old": "name",
-                        "type_old": "old_type",
-                        "type_new": "new_type",
-                    }
-                )
-                .to_dict("records")
-            )
+            new_cols, deleted_cols, renamed_cols, updated_cols = [], [], [], []
+            # Comparing both the schemas here, joined on column id.
+            for old_col, new_col in self._join_on_key(
+                catalog_details["columns"], hql_details["columns"], "id"
+            ):
+                if old_col is None:
+                    new_cols.append(new_col)
+                elif new_col is None:
+                    deleted_cols.append(old_col["name"])
+                elif old_col["name"] != new_col["name"]:
+                    if old_col["type"] == new_col["type"]:
+                        renamed_cols.append(
+                            {"old_name": old_col["name"], "new_name": new_col["name"]}
+                        )
+                elif old_col["type"] != new_col["type"]:
+                    updated_cols.append(
+                        {
+                            "name": old_col["name"],
+                            "old_type": old_col["type"],
+                            "new_type": new_col["type"],
+                        }
+                    )
 
             comparison_results["columns"] = {
-                "new": sorted(new_cols, key=itemgetter("id")),
+                "new": new_cols,
                 "dropped": deleted_cols,
                 "renamed": renamed_cols,
                 "updated": updated_cols,
@@ -231,51 +377,19 @@ class IcebergSchemaHandler:
         catalog_part_columns = catalog_details.get("partition_columns")
         hql_part_columns = hql_details.get("partition_columns")
         if catalog_part_columns and hql_part_columns:
-            catalog_part_df = pd.DataFrame(catalog_part_columns)
-            if self.migration:
-                catalog_part_df = catalog_part_df.rename(columns={"Name": "name"})
-            catalog_part_df = catalog_part_df[["field-id", "name"]]
-            # Filter the commented=True columns
-            filtered_part_cols = list(
-                filter(lambda x: not x["commented"], hql_part_columns)
-            )
-            hql_part_df = pd.DataFrame(filtered_part_cols)[["field-id", "name"]]
-            # Compare partition columns here.
-            merged_part_df = pd.merge(
-                catalog_part_df,
-                hql_part_df,
-                on=["field-id"],
-                how="outer",
-                suffixes=["_old", "_new"],
-            )
-            # new partitions cols
-            new_part_cols = (
-                merged_part_df.loc[
-                    lambda df: (df["name_old"].isna()), ["field-id", "name_new"]
-                ]
-                .rename(columns={"name_new": "name"})
-                .to_dict("records")
-            )
-
-            # dropped partition cols
-            dropped_part_cols = [
-                row["name_old"]
-                for row in merged_part_df.loc[
-                    lambda df: (df["name_new"].isna()), ["name_old"]
-                ].to_dict("records")
-            ]
-
-            # replaced partition cols
-            replaced_part_cols = (
-                merged_part_df.loc[
-                    lambda df: (df["name_old"] != df["name_new"])
-                    & (df["name_old"].notna())
-                    & (df["name_new"].notna()),
-                    ["name_old", "name_new"],
-                ]
-                .rename(columns={"name_old": "old_name", "name_new": "new_name"})
-                .to_dict("records")
-            )
+            new_part_cols, dropped_part_cols, replaced_part_cols = [], [], []
+            # Compare partition columns here, joined on field-id.
+            for old_col, new_col in self._join_on_key(
+                catalog_part_columns, hql_part_columns, "field-id"
+            ):
+                if old_col is None:
+                    new_part_cols.append(new_col)
+                elif new_col is None:
+                    dropped_part_cols.append(old_col["name"])
+                elif old_col["name"] != new_col["name"]:
+                    replaced_part_cols.append(
+                        {"old_name": old_col["name"], "new_name": new_col["name"]}
+                    )
         else:
             replaced_part_cols = []
             dropped_part_cols = catalog_part_columns
@@ -283,7 +397,8 @@ class IcebergSchemaHandler:
 
         # Updating comparison_results dict with Partition cols
         comparison_results["partition_columns"] = {
-            "new": sorted(new_part_cols, key=itemgetter("field-id")),
+            # in field-id order already, from the join or from the HQL parse
+            "new": new_part_cols,
             "dropped": dropped_part_cols,
             "replaced": replaced_part_cols,
         }
@@ -295,25 +410,17 @@ class IcebergSchemaHandler:
             if catalog_tblprops and hql_tblprops:
                 self.logger.debug("Both CATALOG and HQL Props are present.")
                 # Checks keys that are removed
-                removed_props: List[str] = list(
-                    set(catalog_tblprops.keys()) - set(hql_tblprops.keys())
-                )
-                # Check for any new key added
-                new_keys = list(set(hql_tblprops.keys()) - set(catalog_tblprops.keys()))
-                new_props: Union[Dict[str, str], dict] = (
-                    {new_prop: hql_tblprops[new_prop] for new_prop in new_keys}
-                    if new_keys
-                    else {}
-                )
-                # Check for updated columns
-                common_keys = list(
-                    set(catalog_tblprops.keys()).intersection(set(hql_tblprops.keys()))
-                )
-                updated_props: Union[Dict[str, str], dict] = (
-                    {ckey: hql_tblprops[ckey] for ckey in common_keys}
-                    if common_keys
-                    else {}
-                )
+                removed_props: List[str] = [
+                    key for key in catalog_tblprops if key not in hql_tblprops
+                ]
+                new_props: Dict[str, str] = {}
+                updated_props: Dict[str, str] = {}
+                # New keys and keys with a changed value, in one pass.
+                for key, value in hql_tblprops.items():
+                    if key not in catalog_tblprops:
+                        new_props[key] = value
+                    elif catalog_tblprops[key] != value:
+                        updated_props[key] = value
             else:
                 updated_props = {}
                 removed_props = (
@@ -333,6 +440,34 @@ class IcebergSchemaHandler:
         }
         return comparison_results
 
+    def _get_cache_path(self, metadata_json_path: str) -> str:
+        """Get the on-disk cache file of the comparison results for this HQL
+        and metadata file. A new metadata file is written on every change of
+        an Iceberg table, so a changed table or HQL gets a new cache file."""
+        cache_key = "\0".join([self.ic_catalog, self.table, metadata_json_path, self.hql])
+        return os.path.join(
+            SCHEMA_CACHE_DIR, f"{hashlib.sha256(cache_key.encode('utf-8')).hexdigest()}.json"
+        )
+
+    def _read_cached_updates(self, cache_path: str) -> Union[Dict[str, Any], None]:
+        """Read the cached comparison results, None if there are none."""
+        try:
+            with open(cache_path, "r", encoding="utf-8") as fs:
+                cached = json.load(fs)
+        except (OSError, ValueError):
+            return None
+        self.logger.debug("Using cached schema updates for %s", self.table)
+        return cached
+
+    def _write_cached_updates(self, cache_path: str, updates: Dict[str, Any]) -> None:
+        """Write the comparison results to the on-disk cache, if possible."""
+        try:
+            os.makedirs(SCHEMA_CACHE_DIR, exist_ok=True)
+            with open(cache_path, "w", encoding="utf-8") as fs:
+                json.dump(updates, fs)
+        except (OSError, TypeError, ValueError) as ex:
+            self.logger.debug("Schema updates not cached for %s: %s", self.table, ex)
+
     def get_schema_updates(self) -> Dict[str, Any]:
         """
         Compares schema details between HQL and catalog (Glue) to identify changes.
@@ -364,14 +499,24 @@ class IcebergSchemaHandler:
                     }
                 }
 
+        If the EASY_ALTERATOR_SCHEMA_CACHE environment variable is set, the
+        results for tables that are already ICEBERG are cached on disk and
+        reused as long as neither the HQL nor the table has changed.
+
         Raises:
             ValueError: If catalog type is not supported or schema details cannot be fetched
         """
+        cache_path = None
         h_columns, h_partition_cols, h_tblprop = self._get_schema_details_hql()
         if self.catalog == "glue":
             tbl_details = get_table_details(self._db, self._table)["Table"]
             if not self.migration:
                 metadata_path = self._get_metadata_location(tbl_details)
+                if os.environ.get(SCHEMA_CACHE_ENV):
+                    cache_path = self._get_cache_path(metadata_path)
+                    cached_updates = self._read_cached_updates(cache_path)
+                    if cached_updates is not None:
+                        return cached_updates
                 # c_ is to identify catalog columns, i.e. table details in catalog right now
                 c_columns, c_partition_cols, c_tblprop = (
                     self._get_schema_details_metadata(metadata_path)
@@ -402,9 +547,13 @@ class IcebergSchemaHandler:
         # Filter out all the keys that has no data from results nested dict
         cleaned_result = self.clean_results(results)
 
-        return cleaned_result if cleaned_result.get("columns") or \
-                cleaned_results.get("partition_columns") or \
-                cleaned_results.get("tblprops") else {}
+        has_updates = any(
+            cleaned_result.get(key) for key in ("columns", "partition_columns", "tblprops")
+        )
+        updates = cleaned_result if has_updates else {}
+        if cache_path:
+            self._write_cached_updates(cache_path, updates)
+        return updates
 
     def clean_results(self, result: Union[Dict, List]) -> Dict[str, Any]:
         """
@@ -421,7 +570,14 @@ class IcebergSchemaHandler:
             Output: {'b': {'d': [1,2]}, 'e': [1,2,3]}
         """
         if isinstance(result, dict):
+            # nothing to remove and nothing nested, no need for a copy
+            if all(v and not isinstance(v, (dict, list)) for v in result.values()):
+                return result
             return {k: self.clean_results(v) for k, v in result.items() if v}
         if isinstance(result, list):
-            return [self.clean_results(x) for x in result] if result else None
+            if not result:
+                return None
+            if not any(isinstance(x, (dict, list)) for x in result):
+                return result
+            return [self.clean_results(x) for x in result]
         return result
\ No newline at end of file
@@ -1,28 +1,33 @@
 """Module for Validation Rules."""
 
 import re
-import pandas as pd
 import logging
 
 logger = logging.getLogger('EA.rule_book')
 
+# All patterns are lowercase and case-sensitive: DDL strings are lowercased
+# once before they reach the rules (see `run_checks`). SQL identifiers and
+# serde class paths are ASCII, so `\w` is restricted with re.ASCII.
+EXTERNAL_RGX = re.compile(r"create\s*(external)\s*table", re.ASCII)
+STORED_AS_RGX = re.compile(r"stored\s+as\s+(\w+)", re.ASCII)
+ROW_FORMAT_RGX = re.compile(r"row\s+format\s+serde\s+'([\w.]+)'", re.ASCII)
+INPUT_FORMAT_RGX = re.compile(r"inputformat\s+'([\w.]+)'", re.ASCII)
+OUTPUT_FORMAT_RGX = re.compile(r"outputformat\s+'([\w.]+)'", re.ASCII)
+PARTITION_RGX = re.compile(r"partitioned\s+by\s+\(([\w`\s,]+)\)", re.ASCII)
+USING_FORMAT_RGX = re.compile(r"using\s+(\w+)", re.ASCII)
+
 
 def external_table_check(table_obj):
     """
     Checks if the table is EXTERNAL Table or not.
-    :param table_obj: str or dict instance
+    :param table_obj: str (lowercased DDL) or dict instance
     :return: bool
     """
     if isinstance(table_obj, dict):
         glue_tbl_type = table_obj["Table"]["TableType"]
         return True if glue_tbl_type.lower() == "external_table" else False
     elif isinstance(table_obj, str):
-        ext_regex = r"CREATE\s*(EXTERNAL)\s*table"
-        match = re.search(ext_regex, table_obj, flags=re.IGNORECASE)
-        if match:
-            return True if match.group(1).lower() == "external" else False
-        else:
-            return False
+        return bool(EXTERNAL_RGX.search(table_obj))
     else:
         raise Exception("Passed object for validation is neither string nor dict.")
 
@@ -30,7 +35,7 @@ def external_table_check(table_obj):
 def parquet_check(table_obj):
     """
     Checks if the table is Parquet table or not
-    :param table_obj: str or dict instance
+    :param table_obj: str (lowercased DDL) or dict instance
     :return: bool
     """
     PARQUET_ROW_FORMAT = "org.apache.hadoop.hive.ql.io.parquet.serde.ParquetHiveSerDe"
@@ -48,30 +53,30 @@ def parquet_check(table_obj):
             return False
 
     def check_str_format(table_str):
-        store_regex = r"STORED\s+AS\s+(\w+)"
-        match = re.search(store_regex, table_str, flags=re.IGNORECASE)
+        # Both `STORED AS PARQUET` and the parquet serde classes contain the
+        # word, so a plain substring test rejects most other tables early.
+        if "parquet" not in table_str:
+            return False
+        match = STORED_AS_RGX.search(table_str)
         if not match:
             return False
-        stored_as = match.group(1).lower()
+        stored_as = match.group(1)
         if stored_as == "parquet":
             return True
         if stored_as != "inputformat":
             return False
 
-        row_fmt_regex = r"ROW\s+FORMAT\s+SERDE\s+'([\w\.]+)'"
-        row_fmt_match = re.search(row_fmt_regex, table_str, flags=re.IGNORECASE)
-        if not row_fmt_match or row_fmt_match.group(1).lower() != PARQUET_ROW_FORMAT.lower():
+        row_fmt_match = ROW_FORMAT_RGX.search(table_str)
+        if not row_fmt_match or row_fmt_match.group(1) != PARQUET_ROW_FORMAT.lower():
             return False
 
-        input_serde_regex = r"INPUTFORMAT\s+'([\w\.]+)'"
-        output_serde_regex = r"OUTPUTFORMAT\s+'([\w\.]+)'"
-        input_serde_match = re.search(input_serde_regex, table_str, flags=re.IGNORECASE)
-        output_serde_match = re.search(output_serde_regex, table_str, flags=re.IGNORECASE)
+        input_serde_match = INPUT_FORMAT_RGX.search(table_str)
+        output_serde_match = OUTPUT_FORMAT_RGX.search(table_str)
         return (
             input_serde_match
             and output_serde_match
-            and input_serde_match.group(1).lower() == INPUT_SERDE.lower()
-            and output_serde_match.group(1).lower() == OUTPUT_SERDE.lower()
+            and input_serde_match.group(1) == INPUT_SERDE.lower()
+            and output_serde_match.group(1) == OUTPUT_SERDE.lower()
         )
 
     if isinstance(table_obj, dict):
@@ -84,35 +89,36 @@ def partition_col_check(hql_str_dict, catalog_partn_cols):
     """
     Check if the partition columns are changed in provided table HQL.
     Compares the partition columns from the already existing column.
-    :param hql_str_dict: hql string or partition cols list of dict
+    :param hql_str_dict: lowercased hql string or partition cols list of dict
     :param catalog_partn_cols: already existing partition columns list
     :return: bool
     """
     def parse_hql(hql_str):
-        partition_regex = r"PARTITIONED\s+BY\s+\(([\w`\s,]+)\)"
-        match = re.search(partition_regex, hql_str, flags=re.IGNORECASE)
+        match = PARTITION_RGX.search(hql_str)
         if match:
-            partition_cols = re.sub(r"\s+", " ", match.group(1).lower().strip().replace("`", "")).split(",")
+            partition_cols = re.sub(r"\s+", " ", match.group(1).strip().replace("`", "")).split(",")
             return [{"Name": col.split()[0], "Type": col.split()[1]} for col in partition_cols]
         return []
 
-    hql_df = pd.DataFrame(hql_str_dict if isinstance(hql_str_dict, list) else parse_hql(hql_str_dict))
-    catalog_df = pd.DataFrame(catalog_partn_cols)
+    hql_pcols = hql_str_dict if isinstance(hql_str_dict, list) else parse_hql(hql_str_dict)
 
-    if hql_df.shape[0] != catalog_df.shape[0]:
+    if len(hql_pcols) != len(catalog_partn_cols):
         logger.error("=> Partitions column mismatch")
         return False
 
-    if hql_df.empty or catalog_df.empty:
+    if not hql_pcols:
         logger.info("=> No partitions found.")
         return True
 
-    merged_df = pd.merge(hql_df, catalog_df, on="Name", how="outer", suffixes=("_new", "_old"))
-    if merged_df["Type_new"].isna().any() or merged_df["Type_old"].isna().any():
+    # partition column name -> data type
+    hql_types = {col.get("Name"): col.get("Type") for col in hql_pcols}
+    catalog_types = {col.get("Name"): col.get("Type") for col in catalog_partn_cols}
+    if hql_types.keys() != catalog_types.keys() or None in hql_types.values() \
+            or None in catalog_types.values():
         logger.error("Partition column mismatch.")
         return False
 
-    if (merged_df["Type_new"] != merged_df["Type_old"]).any():
+    if hql_types != catalog_types:
         logger.error("=> Partition column data type mismatch.")
         return False
 
@@ -120,29 +126,27 @@ def partition_col_check(hql_str_dict, catalog_partn_cols):
     return True
 
 
-def check_dtype_compatibility(df, query_engine="athena"):
+def check_dtype_compatibility(datatype_changes, query_engine="athena"):
     """
     Checks if the changed data type of the column is compatible with the 
     new data type for the mentioned query engine
-    :param df: pandas dataframe
+    :param datatype_changes: list of dict with Name, Type_old and Type_new
     :param query_engine: str, query engine name. Default is "athena"
-    :return: bool
+    :return: tuple (bool, compatible changes list, incompatible changes list)
     """
     compatibility_dict = QUERY_ENG_DTYPE_COMPATIBILITY[query_engine]
-    df["compatible"] = df.apply(
-        lambda x: 1
-        if x["Type_new"].upper() in compatibility_dict.get(x["Type_old"].upper(), [])
-        else 0,
-        axis=1,
-    )
-    incompatible_cols = df[df["compatible"] == 0]
-    compatible_cols = df[df["compatible"] == 1]
-    if not incompatible_cols.empty:
+    compatible_cols, incompatible_cols = [], []
+    for col in datatype_changes:
+        if col["Type_new"].upper() in compatibility_dict.get(col["Type_old"].upper(), []):
+            compatible_cols.append(col)
+        else:
+            incompatible_cols.append(col)
+    if incompatible_cols:
         logger.info("==> Incompatible data type change found in the DDL: ")
-        for row in incompatible_cols.to_dict(orient="records"):
+        for col in incompatible_cols:
             logger.warning(
                 '%s data type changed from %s to %s',
-                row["Name"], row["Type_old"], row["Type_new"]
+                col["Name"], col["Type_old"], col["Type_new"]
             )
         logger.warning(
             "==> Please change the data type of the following columns to the compatible data type."
@@ -154,9 +158,8 @@ def check_dtype_compatibility(df, query_engine="athena"):
 def iceberg_check(table_obj) -> bool:
     # TODO: Implement code with regex to check from HQL.
     if isinstance(table_obj, str):
-        FMT_RGX = r"USING\s+(\w+)"
-        fmt_match = re.search(FMT_RGX, table_obj, flags=re.IGNORECASE)
-        if not fmt_match or fmt_match.group(1).upper() != "ICEBERG":
+        fmt_match = USING_FORMAT_RGX.search(table_obj)
+        if not fmt_match or fmt_match.group(1) != "iceberg":
             return False
         else:
             return True
@@ -167,11 +170,28 @@ def iceberg_check(table_obj) -> bool:
         return True if table_format == "ICEBERG" else False
 
 
+def run_checks(rules, table_obj):
+    """
+    Runs the provided rules against the table object.
+    DDL strings are lowercased once here instead of every rule
+    matching case-insensitively on its own.
+    :param rules: sequence of (rule name, rule function) pairs
+    :param table_obj: str or dict instance
+    :return: dict of rule name and bool
+    """
+    if isinstance(table_obj, str):
+        table_obj = table_obj.lower()
+    return {name: bool(rule(table_obj)) for name, rule in rules}
+
+
 INITIAL_RULE_DICT = {
     "EXTERNAL_TABLE": external_table_check,
     "PARQUET_CHECK": parquet_check,
     "ICEBERG_CHECK": iceberg_check
 }
+# Ordered (name, rule) pairs used for dispatch, INITIAL_RULE_DICT is kept
+# for backward compatibility.
+INITIAL_RULES = tuple(INITIAL_RULE_DICT.items())
 
 QUERY_ENG_DTYPE_COMPATIBILITY = {
     "athena": {
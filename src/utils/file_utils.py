@@ -1,11 +1,36 @@
 """Module to handle file and filepath related operations."""
 
+import hashlib
+import json
 import logging
 import os
-from utils.s3_utils import validate_s3_object, list_s3_objects, read_s3_file
+from functools import lru_cache
+from pathlib import Path
+from utils.s3_utils import validate_s3_object, list_s3_objects, read_s3_file, get_last_modified
 import yaml
 
+try:
+    # LibYAML based loader, much faster than the pure python one.
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
 logger = logging.getLogger('EA.utils.file_utils')
+# Parsed YAML configs are cached here as JSON, which loads much faster.
+YAML_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".easy-alterator", "cache")
+
+
+@lru_cache(maxsize=None)
+def _is_valid_path(path):
+    """
+    Checks if a single file or directory path is valid.
+    Results are cached, so the same path is validated only once per run.
+    :param path: str
+    :return: bool
+    """
+    if path.startswith("s3://"):
+        return validate_s3_object(path)
+    return os.path.exists(path)
 
 
 def check_paths(files):
@@ -16,30 +41,17 @@ def check_paths(files):
     :return: None
     """
     valid = True
+    if isinstance(files, str):
+        files = [files]
     if isinstance(files, list):
-        for file_path in files:
-            if file_path.startswith("s3://"):
-                valid = validate_s3_object(file_path)
-                if not valid:
-                    valid = False
-                    logger.error(f"{file_path} is invalid.")
-            else:
-                if not os.path.exists(file_path):
-                    valid = False
-                    logger.error(f"{file_path} is invalid.")
-    else:
-        if isinstance(files, str):
-            if files.startswith("s3://"):
-                valid = validate_s3_object(files)
-                if not valid:
-                    valid = False
-                    logger.error(f"{files} is invalid.")
-            elif not os.path.exists(files):
+        # dict.fromkeys removes duplicates while keeping the order for the logs
+        for file_path in dict.fromkeys(files):
+            if not _is_valid_path(file_path):
                 valid = False
-                logger.error(f"{files} is invalid.")
-        else:
-            valid = False
-            logger.error("path format is invalid.")
+                logger.error("%s is invalid.", file_path)
+    else:
+        valid = False
+        logger.error("path format is invalid.")
     if not valid:
         logger.critical("Provided path is invalid.")
         raise Exception("One or more provided paths are invalid")
@@ -89,7 +101,7 @@ def filter_files(paths, prefix, suffix, **kwargs):
                     )
                 )
             if table_list:
-                logger.debug(f"inside filter 2 {len(table_list)}")
+                logger.debug("inside filter 2 %s", len(table_list))
                 # filtering the file only for the tables mentioned in table list.
                 if is_cloud_path:
                     cloud_filenames = [f.rsplit("/", 1)[1] for f in filtered_files]
@@ -128,15 +140,81 @@ def filter_files(paths, prefix, suffix, **kwargs):
     return file_list
 
 
+def read_file(path):
+    """
+    Reads the whole file from S3 or local filesystem as text.
+    :param path: str
+    :return: str
+    """
+    if path.startswith("s3://"):
+        return read_s3_file(path)
+    return Path(path).read_text(encoding="utf-8")
+
+
 def read_yaml(path):
     """
     Reads yaml file from the provided path.
     :param path:
     :return: json object
     """
+    return yaml.load(read_file(path), Loader=SafeLoader)
+
+
+def validate_ddl_config(config, path, path_key=None):
+    """
+    Checks the structure of the DDL config read from the provided path, so
+    a malformed config fails before any DDL file is read.
+    The config needs a `tables` list of table names, and `path_key`, when
+    present in the config, needs to map to a path string.
+    :param config: dict
+    :param path: str
+    :param path_key: str
+    :return: None
+    """
+    if not isinstance(config, dict):
+        raise Exception(f"DDL config {path} should be a mapping, found {type(config).__name__}.")
+    tables = config.get("tables")
+    if not isinstance(tables, list) or not all(isinstance(tbl, str) for tbl in tables):
+        raise Exception(f"DDL config {path} should have `tables` as a list of table names.")
+    if path_key in config and not isinstance(config[path_key], str):
+        raise Exception(f"`{path_key}` in DDL config {path} should be a path string.")
+
+
+def read_yaml_cached(path):
+    """
+    Reads yaml file from the provided path, using a JSON copy of the parsed
+    content cached in YAML_CACHE_DIR when the yaml file hasn't changed since.
+    The cache is keyed by the file's mtime, or LastModified for S3 files.
+    Falls back to read_yaml if the cache can't be used.
+    :param path:
+    :return: json object
+    """
     if path.startswith("s3://"):
-        data = yaml.safe_load(read_s3_file(path))
+        last_modified = get_last_modified(path)
+        source_version = last_modified.isoformat() if last_modified else None
     else:
-        with open(path, "r", encoding="utf-8") as fs:
-            data = yaml.safe_load(fs)
+        source_version = str(os.path.getmtime(path))
+    if source_version is None:
+        return read_yaml(path)
+
+    cache_path = os.path.join(
+        YAML_CACHE_DIR, f"{hashlib.sha1(path.encode('utf-8')).hexdigest()}.json"
+    )
+    try:
+        with open(cache_path, "r", encoding="utf-8") as fs:
+            cached = json.load(fs)
+        if cached["source_version"] == source_version:
+            logger.debug("Using cached config for %s", path)
+            return cached["data"]
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+
+    data = read_yaml(path)
+    try:
+        os.makedirs(YAML_CACHE_DIR, exist_ok=True)
+        with open(cache_path, "w", encoding="utf-8") as fs:
+            json.dump({"source_version": source_version, "data": data}, fs)
+    except (OSError, TypeError, ValueError) as ex:
+        # e.g. read-only home directory or values JSON can't represent
+        logger.debug("Config cache not written for %s: %s", path, ex)
     return data
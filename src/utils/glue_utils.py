@@ -1,37 +1,138 @@
 """Module to handle AWS Glue Catalog related operations"""
 
 from copy import deepcopy
+from functools import lru_cache
+import threading
+from concurrent.futures import ThreadPoolExecutor
 import boto3
+from botocore.config import Config
 from botocore.exceptions import ClientError
 import logging
 from utils.helper import get_aws_region
 
 REGION = get_aws_region()
 logger = logging.getLogger('EA.utils.glue_utils')
+CLIENT_CONFIG = Config(max_pool_connections=32, retries={"mode": "adaptive"})
+_client = None
+_client_lock = threading.Lock()
+# Max concurrent GetTable calls in batch_get_tables.
+BATCH_WORKERS = 16
+# Table details listed by get_tables, keyed by (database, table). Used by
+# get_table_details before falling back to a GetTable call.
+_TABLE_CACHE = {}
 
 
+def _get_client():
+    """
+    Gets the shared glue client.
+    boto3 clients are thread safe, so a single client is created lazily and
+    shared by all threads. Its connection pool is sized for the worker threads
+    so that concurrent calls reuse kept-alive HTTPS connections.
+    :return: boto3 glue client
+    """
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = boto3.session.Session().client(
+                    "glue", region_name=REGION, config=CLIENT_CONFIG
+                )
+    return _client
+
+
+@lru_cache(maxsize=1024)
 def get_table_details(database, table):
     """
     Gets the table details from the AWS Glue catalog.
-    :param client: boto3 client
+    Returns the error response if the table doesn't exist, any other error
+    (e.g. throttling, access denied) is raised, so it isn't taken for a new
+    table. Responses are cached per (database, table) for the rest of the
+    run, raised errors are not, so the returned dict is shared and must not
+    be modified. The cache is cleared by update_table_schema, or with
+    get_table_details.cache_clear().
+    Tables of databases already listed with get_tables need no GetTable call.
     :param database: str
     :param table: str
     :return: dict
     """
+    listed = _TABLE_CACHE.get((database, table))
+    if listed is not None:
+        return listed
     try:
-        client = boto3.client("glue", region_name=REGION)
+        client = _get_client()
         response = client.get_table(DatabaseName=database, Name=table)
         return response
     except ClientError as error:
         err_response = error.response
         if err_response["Error"]["Code"] == "EntityNotFoundException":
-            logger.error(err_response["Message"])
-        return err_response
+            logger.error(err_response["Error"]["Message"])
+            return err_response
+        logger.critical("Error occured while getting table from catalog.")
+        raise error
     except Exception as ex:
         logger.critical("Error occured while getting table from catalog.")
         raise ex
 
 
+def get_tables(database):
+    """
+    Gets the details of all the tables in a database from the AWS Glue catalog.
+    Uses the paginated GetTables API, i.e. one call per page of tables
+    instead of one GetTable call per table.
+    The listed tables are also kept for later get_table_details calls.
+    Returns None if the tables couldn't be listed.
+    :param database: str
+    :return: dict of table name and table details (same format as get_table_details)
+    """
+    paginator = _get_client().get_paginator("get_tables")
+    tables = {}
+    try:
+        for page in paginator.paginate(DatabaseName=database):
+            for table in page["TableList"]:
+                tables[table["Name"]] = {"Table": table}
+    except ClientError as error:
+        err_response = error.response
+        if err_response["Error"]["Code"] == "EntityNotFoundException":
+            # every table of a database that doesn't exist is a new table
+            logger.error(err_response["Error"]["Message"])
+            return {}
+        logger.warning("Tables couldn't be listed for %s: %s", database, err_response["Error"])
+        return None
+    _TABLE_CACHE.update(((database, name), details) for name, details in tables.items())
+    return tables
+
+
+def batch_get_tables(database, tables):
+    """
+    Gets the details of the given tables of a database from the AWS Glue catalog.
+    Glue has no batch GetTable API, so the GetTable calls are fanned out
+    over a thread pool instead of being made one after another.
+    Tables whose lookup failed are left out, so one failure doesn't fail
+    the whole batch.
+    :param database: str
+    :param tables: list of table names
+    :return: dict of table name and table details (same format as get_table_details)
+    """
+    tables = list(dict.fromkeys(tables))
+    if not tables:
+        return {}
+
+    def _get_table(table):
+        try:
+            return get_table_details(database, table)
+        except Exception as ex:
+            logger.warning("Table details couldn't be fetched for %s.%s: %s", database, table, ex)
+            return None
+
+    with ThreadPoolExecutor(max_workers=min(BATCH_WORKERS, len(tables))) as executor:
+        responses = executor.map(_get_table, tables)
+        return {
+            table: response
+            for table, response in zip(tables, responses)
+            if response is not None
+        }
+
+
 def update_table_schema(table, new_cols, del_cols):
     """
     Update the table schema in AWS Glue catalog.
@@ -42,7 +143,7 @@ def update_table_schema(table, new_cols, del_cols):
     :param del_cols: list of dict
     :return: tuple: (Bool, string, dict)
     """
-    glue_client = boto3.client("glue", region_name=REGION)
+    glue_client = _get_client()
     updated_table = deepcopy(table)
     db_name = table["Table"]["DatabaseName"]
     table_name = table["Table"]["Name"]
@@ -81,6 +182,9 @@ def update_table_schema(table, new_cols, del_cols):
     # Check if the update is successful or not.
     if up_response["ResponseMetadata"]["HTTPStatusCode"] == 200:
         logger.info("Update successful for %s.%s", db_name, table_name)
+        # cached details of the table are outdated now
+        _TABLE_CACHE.pop((db_name, table_name), None)
+        get_table_details.cache_clear()
         return True, f"{db_name}.{table_name}", None
     else:
         logger.error("Update failure for %s.%s", db_name, table_name)
@@ -95,7 +199,7 @@ def get_latest_table_version(database, table):
     :param table: str
     :return: str
     """
-    client = boto3.client("glue", region_name=REGION)
+    client = _get_client()
     try:
         response = client.get_table_versions(DatabaseName=database, TableName=table)
         if response['TableVersions']:
@@ -107,7 +211,7 @@ def get_latest_table_version(database, table):
     except ClientError as error:
         err_response = error.response
         if err_response["Error"]["Code"] == "EntityNotFoundException":
-            logger.error(err_response["Message"])
+            logger.error(err_response["Error"]["Message"])
             raise error
     except Exception as ex:
         logger.critical("Error occured while getting table from catalog.")
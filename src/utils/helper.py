@@ -3,10 +3,13 @@
 import os
 import boto3
 import logging
-import pandas as pd
+from functools import lru_cache
 from rules import rule_book as rbook
 
 logger = logging.getLogger('EA.utils.helper')
+ACCOUNT_ID_PLACEHOLDER = "{aws_account_id}"
+# initial_checks results for Glue catalog tables, see cached_initial_checks
+_CATALOG_CHECKS_CACHE = {}
 
 
 def initial_checks(table_info):
@@ -19,80 +22,139 @@ def initial_checks(table_info):
     # 1. TABLE_TYPE is EXTERNAL
     # 2. TABLE IS A PARQUET TABLE => check serde info
     # Run all the initial rules before sending the response.
-    validation_results = {}
-    for key, value in rbook.INITIAL_RULE_DICT.items():
-        vresult = value(table_info)
+    validation_results = rbook.run_checks(rbook.INITIAL_RULES, table_info)
+    for key, vresult in validation_results.items():
         if not vresult:
             logger.error("%s validation failed.", key)
-            validation_results[key] = False
-        else:
-            validation_results[key] = True
     logger.info("Validation results %s", validation_results)
     return validation_results
 
 
+@lru_cache(maxsize=256)
+def _ddl_initial_checks(ddl):
+    """
+    initial_checks for DDL strings, cached on the DDL itself.
+    :param ddl: str
+    :return: dict
+    """
+    return initial_checks(ddl)
+
+
+def cached_initial_checks(table_info):
+    """
+    Memoized initial_checks, for callers validating the same DDL or
+    catalog table more than once in a process.
+    Glue table details are keyed on database, table name and UpdateTime,
+    which changes with every update of the table.
+    The returned dict is shared and must not be modified.
+    :param table_info: str or dict
+    :return: dict
+    """
+    if isinstance(table_info, str):
+        return _ddl_initial_checks(table_info)
+    tbl = table_info["Table"]
+    if tbl.get("UpdateTime") is None:
+        return initial_checks(table_info)
+    key = (tbl.get("DatabaseName"), tbl["Name"], tbl["UpdateTime"])
+    validation_results = _CATALOG_CHECKS_CACHE.get(key)
+    if validation_results is None:
+        validation_results = _CATALOG_CHECKS_CACHE[key] = initial_checks(table_info)
+    return validation_results
+
+
+def normalize_ddl(content, aws_account_id):
+    """
+    Lowercases and strips the DDL content and fills in the
+    `{aws_account_id}` placeholder.
+    Uses str.replace instead of str.format, so DDLs without the placeholder
+    are not scanned again and other curly braces in the DDL don't fail.
+    :param content: str
+    :param aws_account_id: str
+    :return: str
+    """
+    content = content.lower().strip()
+    if ACCOUNT_ID_PLACEHOLDER in content:
+        content = content.replace(ACCOUNT_ID_PLACEHOLDER, aws_account_id)
+    return content
+
+
 def compare_schema(new_col_list, old_col_list):
     """Compares the schema for provided column lists.
     Args:
-        new_col_list (list of dict): _description_
-        old_col_list (list of dict): _description_
+        new_col_list (list of dict): columns with Name and Type, e.g. from the HQL
+        old_col_list (list of dict): columns with Name and Type, e.g. from the catalog
 
     Returns:
-        tuple (list of dict, list of dict, pandas Dataframe):
+        tuple (list of dict, list of dict, list of dict):
         (new columns, deleted columns, data type changed columns)
+        Data type changed columns have Name, Type_new and Type_old keys.
+        All lists are sorted by column name.
     """
     # Schema comparison logic ==>
-    new_df = pd.DataFrame(new_col_list)
-    old_df = pd.DataFrame(old_col_list)
-
-    new_df["From"] = "new"
-    old_df["From"] = "old"
-
-    # includes added, deleted and data type changed columns
-    combined_cols_df = pd.merge(
-        new_df, old_df, on=["Name"], how="outer", suffixes=("_new", "_old")
-    )[["Name", "Type_new", "Type_old"]]
-
-    # new columns df
-    new_cols_df = combined_cols_df[combined_cols_df["Type_old"].isna()]
-    # print("new df \n", new_cols_df)
-
-    # deleted columns df
-    deleted_cols_df = combined_cols_df[combined_cols_df["Type_new"].isna()]
-    # print("deleted df \n",deleted_cols_df)
-
-    # getting columns with data type change
-    datatype_changes = combined_cols_df[
-        (~combined_cols_df["Type_old"].isna())
-        & (~combined_cols_df["Type_new"].isna())
-        & (combined_cols_df["Type_old"] != combined_cols_df["Type_new"])
-    ]
-    # print("datatype changes \n", datatype_changes)
+    new_types = {col["Name"]: col["Type"] for col in new_col_list}
+    old_types = {col["Name"]: col["Type"] for col in old_col_list}
 
     # new columns
-    added_cols = new_cols_df.rename(columns={"Type_new": "Type"})[
-        ["Name", "Type"]
-    ].to_dict("records")
+    added_cols = [
+        {"Name": name, "Type": new_types[name]}
+        for name in sorted(new_types.keys() - old_types.keys())
+    ]
     # deleted columns
-    deleted_cols = deleted_cols_df.rename(columns={"Type_old": "Type"})[
-        ["Name", "Type"]
-    ].to_dict("records")
+    deleted_cols = [
+        {"Name": name, "Type": old_types[name]}
+        for name in sorted(old_types.keys() - new_types.keys())
+    ]
+    # getting columns with data type change
+    datatype_changes = [
+        {"Name": name, "Type_new": new_types[name], "Type_old": old_types[name]}
+        for name in sorted(new_types.keys() & old_types.keys())
+        if new_types[name] != old_types[name]
+    ]
 
     logger.info("++++ Newly Added columns ==> %s", added_cols)
     logger.info("---- Deleted columns ===> %s", deleted_cols)
     logger.info("++++ New columns count ==> %d", len(added_cols))
     logger.info("---- Deleted columns count ===> %d", len(deleted_cols))
 
-    if not datatype_changes.empty:
+    if datatype_changes:
         logger.warning(
-            '+-+- data type changes records for: %s', datatype_changes["Name"].to_list()
+            '+-+- data type changes records for: %s', [col["Name"] for col in datatype_changes]
         )
     return added_cols, deleted_cols, datatype_changes
 
 
+def split_type_changes(datatype_changes):
+    """
+    Splits the data type changes into the columns to be added with
+    the new type and the columns to be deleted with the old type, in one pass.
+    :param datatype_changes: list of dict with Name, Type_new and Type_old
+    :return: tuple(list, list)
+    """
+    new_type_cols, old_type_cols = [], []
+    for col in datatype_changes:
+        new_type_cols.append({"Name": col["Name"], "Type": col["Type_new"]})
+        old_type_cols.append({"Name": col["Name"], "Type": col["Type_old"]})
+    return new_type_cols, old_type_cols
+
+
+def type_change_records(datatype_changes):
+    """
+    Converts the data type changes to a list of
+    {"Name": .., "Type": .., "updated_type": ..} dicts.
+    :param datatype_changes: list of dict with Name, Type_new and Type_old
+    :return: list
+    """
+    return [
+        {"Name": col["Name"], "Type": col["Type_old"], "updated_type": col["Type_new"]}
+        for col in datatype_changes
+    ]
+
+
+@lru_cache(maxsize=1)
 def get_account_id():
     """
     Gets the AWS account ID
+    Cached, as the account ID doesn't change for the lifetime of the process.
     :return: str
     """
     return str(
@@ -104,30 +166,31 @@ def get_account_id():
     )
 
 
+@lru_cache(maxsize=1)
 def get_aws_region():
     """
     Gets the AWS region
+    The checks run in order and stop at the first hit, so a boto3 Session
+    is only created if the region isn't set through ENV vars.
+    Cached, as glue_utils and s3_utils both look it up at import.
     :return: str
     """
-    check_external = False
-    region_checks = [
+    region_checks = (
         # check if set through ENV vars
-        os.environ.get('AWS_REGION'),
-        os.environ.get('AWS_DEFAULT_REGION'),
+        lambda: os.environ.get('AWS_REGION'),
+        lambda: os.environ.get('AWS_DEFAULT_REGION'),
         # else check if set in config or in boto already
-        boto3.DEFAULT_SESSION.region_name if boto3.DEFAULT_SESSION else None,
-        boto3.Session().region_name,
-    ]
+        lambda: boto3.DEFAULT_SESSION.region_name if boto3.DEFAULT_SESSION else None,
+        lambda: boto3.Session().region_name,
+    )
 
-    for region in region_checks:
+    for region_check in region_checks:
+        region = region_check()
         if region:
             return region
-        else:
-            check_external = True
-    
-    if check_external:
-        return str(
-            os.popen("curl -s http://169.254.169.254/latest/dynamic/instance-identity/document | jq -r .region")
+
+    return str(
+        os.popen("curl -s http://169.254.169.254/latest/dynamic/instance-identity/document | jq -r .region")
         .read()
         .strip()
     )
@@ -1,10 +1,53 @@
 """Module for S3 related utilities."""
 
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 import boto3
+from botocore.config import Config
 from botocore.exceptions import ClientError
 from utils.helper import get_aws_region
 
+try:
+    # optional, parses big metadata JSON files several times faster.
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
+try:
+    # optional, streams the metadata JSON so only the needed top level keys
+    # are read. The C backend only, the pure Python one is slower than
+    # reading the whole file.
+    import ijson.backends.yajl2_c as ijson
+except ImportError:
+    ijson = None
+
 REGION = get_aws_region()
+# Objects bigger than the first GET are fetched in ranges of RANGE_SIZE
+# bytes, concurrently.
+FIRST_RANGE_SIZE = 8 * 1024 * 1024
+RANGE_SIZE = 16 * 1024 * 1024
+RANGE_WORKERS = 8
+CLIENT_CONFIG = Config(max_pool_connections=32, retries={"mode": "adaptive"})
+_client = None
+_client_lock = threading.Lock()
+
+
+def _get_client():
+    """
+    Gets the S3 client, created on first use and shared across threads.
+    The pool size in CLIENT_CONFIG covers the per-file reads and ranged GETs
+    running at the same time.
+    :return: boto3 s3 client
+    """
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = boto3.session.Session().client(
+                    "s3", region_name=REGION, config=CLIENT_CONFIG
+                )
+    return _client
 
 
 def _get_bucket_key(s3_path):
@@ -29,7 +72,7 @@ def validate_s3_object(s3_path):
     :return: bool
     """
     s3_bucket, s3_key = _get_bucket_key(s3_path)
-    s3 = boto3.client("s3", region_name=REGION)
+    s3 = _get_client()
     try:
         # using list_object_v2 to validate instead of head_object because s3_key can be just path to folder like structure
         response = s3.list_objects_v2(
@@ -42,6 +85,21 @@ def validate_s3_object(s3_path):
     return True
 
 
+def get_last_modified(s3_path):
+    """
+    Gets the last modified time of the S3 object.
+    Returns None if the object can't be accessed.
+    :param s3_path: str
+    :return: datetime
+    """
+    s3_bucket, s3_key = _get_bucket_key(s3_path)
+    try:
+        response = _get_client().head_object(Bucket=s3_bucket, Key=s3_key)
+    except ClientError:
+        return None
+    return response["LastModified"]
+
+
 def list_s3_objects(s3_path):
     """
     Lists all the objects in the S3 path.
@@ -49,7 +107,7 @@ def list_s3_objects(s3_path):
     :return: list
     """
     s3_bucket, s3_key = _get_bucket_key(s3_path)
-    s3 = boto3.client("s3", region_name=REGION)
+    s3 = _get_client()
     keylist = []
     kwargs = {"Bucket": s3_bucket}
     if isinstance(s3_key, str):
@@ -77,16 +135,103 @@ def list_s3_objects(s3_path):
     return keylist
 
 
+def _read_range(s3_bucket, s3_key, start, end):
+    """
+    Reads the inclusive byte range [start, end] of the S3 object.
+    :param s3_bucket: str
+    :param s3_key: str
+    :param start: int
+    :param end: int
+    :return: bytes
+    """
+    response = _get_client().get_object(
+        Bucket=s3_bucket, Key=s3_key, Range=f"bytes={start}-{end}"
+    )
+    return response["Body"].read()
+
+
+def read_s3_bytes(s3_path):
+    """
+    Reads the S3 file as bytes, without decoding it.
+    The first FIRST_RANGE_SIZE bytes are read with a single ranged GET, which
+    covers every regular DDL file. For bigger objects the remaining bytes are
+    fetched concurrently in RANGE_SIZE windows and joined in order.
+    :param s3_path: str
+    :return: bytes
+    """
+    s3_bucket, s3_key = _get_bucket_key(s3_path)
+    s3 = _get_client()
+    try:
+        response = s3.get_object(
+            Bucket=s3_bucket, Key=s3_key, Range=f"bytes=0-{FIRST_RANGE_SIZE - 1}"
+        )
+    except ClientError:
+        return b""
+    content = response["Body"].read()
+    # ContentRange looks like "bytes 0-8388607/20971520"
+    content_range = response.get("ContentRange")
+    total_size = int(content_range.rsplit("/", 1)[1]) if content_range else len(content)
+    if total_size <= len(content):
+        return content
+
+    ranges = [
+        (start, min(start + RANGE_SIZE, total_size) - 1)
+        for start in range(len(content), total_size, RANGE_SIZE)
+    ]
+    with ThreadPoolExecutor(max_workers=min(RANGE_WORKERS, len(ranges))) as executor:
+        chunks = executor.map(lambda r: _read_range(s3_bucket, s3_key, *r), ranges)
+        return b"".join([content, *chunks])
+
+
 def read_s3_file(s3_path):
     """
-    Reads the S3 file.
+    Reads the S3 file as text.
+    Decoded once after all the ranges are joined, as a range can split a
+    multi-byte character.
     :param s3_path: str
     :return: str
     """
+    return read_s3_bytes(s3_path).decode("utf-8")
+
+
+def _stream_json_keys(s3_path, keys):
+    """
+    Streams the S3 JSON object and collects only the given top level keys.
+    Stops reading as soon as all of them are found, so the trailing
+    sections, like the snapshots of an Iceberg metadata file, are not
+    downloaded.
+    :param s3_path: str
+    :param keys: frozenset
+    :return: dict
+    """
     s3_bucket, s3_key = _get_bucket_key(s3_path)
-    s3 = boto3.client("s3", region_name=REGION)
+    body = _get_client().get_object(Bucket=s3_bucket, Key=s3_key)["Body"]
+    found = {}
     try:
-        response = s3.get_object(Bucket=s3_bucket, Key=s3_key)
-    except ClientError:
-        return ""
-    return response["Body"].read().decode("utf-8")
+        for key, value in ijson.kvitems(body, "", use_float=True):
+            if key in keys:
+                found[key] = value
+                if len(found) == len(keys):
+                    break
+    finally:
+        body.close()
+    return found
+
+
+@lru_cache(maxsize=128)
+def load_iceberg_metadata(s3_path, keys=None):
+    """
+    Reads and parses the Iceberg metadata JSON file, once per run.
+    Metadata files are never changed once written, so the parsed dict is
+    cached by path, which skips both the S3 GET and the JSON parse on
+    repeated access. The returned dict is shared and must not be modified.
+    With keys, only these top level keys are needed: if ijson is installed
+    the file is streamed and read up to the last of them, otherwise the whole
+    file is parsed, from the raw bytes without decoding them to str first.
+    :param s3_path: str
+    :param keys: frozenset
+    :return: dict
+    """
+    if keys and ijson is not None:
+        return _stream_json_keys(s3_path, keys)
+    return json_loads(read_s3_bytes(s3_path))